@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
-from typing import List, Optional
+from pathlib import Path
+from typing import Any, List, Optional
 
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.messages import (
@@ -14,10 +16,40 @@ from langchain_core.messages.utils import convert_to_openai_messages
 from browser_use.agent.memory.views import MemoryConfig
 from browser_use.agent.message_manager.service import MessageManager
 from browser_use.agent.message_manager.views import ManagedMessage, MessageMetadata
-from browser_use.utils import time_execution_sync
+from browser_use.utils import time_execution_async, time_execution_sync
 
 logger = logging.getLogger(__name__)
 
+# Default (embedder_provider, embedder_model, embedder_dims) per LLM class name
+_EMBEDDER_BY_LLM: dict[str, tuple[str, str, int]] = {
+	'ChatOpenAI': ('openai', 'text-embedding-3-small', 1536),
+	'ChatGoogleGenerativeAI': ('gemini', 'models/text-embedding-004', 768),
+	'ChatOllama': ('ollama', 'nomic-embed-text', 512),
+}
+
+_OPENAI_ROLE_BY_MESSAGE_TYPE = {
+	'HumanMessage': 'user',
+	'AIMessage': 'assistant',
+	'SystemMessage': 'system',
+}
+
+
+def _to_openai_messages(messages: List[BaseMessage]) -> List[dict[str, Any]]:
+	"""
+	Convert messages to the OpenAI format mem0 expects, reusing the content strings.
+
+	Plain text messages are converted inline; anything langchain has to normalize (multimodal content,
+	tool calls, tool messages) still goes through `convert_to_openai_messages`.
+	"""
+	parsed_messages = []
+	for message in messages:
+		role = _OPENAI_ROLE_BY_MESSAGE_TYPE.get(type(message).__name__)
+		if role is not None and isinstance(message.content, str) and not getattr(message, 'tool_calls', None):
+			parsed_messages.append({'role': role, 'content': message.content})
+		else:
+			parsed_messages.append(convert_to_openai_messages(message))
+	return parsed_messages
+
 
 class Memory:
 	"""
@@ -43,19 +75,9 @@ class Memory:
 			self.config = MemoryConfig(llm_instance=llm, agent_id=f'agent_{id(self)}')
 
 			# Set appropriate embedder based on LLM type
-			llm_class = llm.__class__.__name__
-			if llm_class == 'ChatOpenAI':
-				self.config.embedder_provider = 'openai'
-				self.config.embedder_model = 'text-embedding-3-small'
-				self.config.embedder_dims = 1536
-			elif llm_class == 'ChatGoogleGenerativeAI':
-				self.config.embedder_provider = 'gemini'
-				self.config.embedder_model = 'models/text-embedding-004'
-				self.config.embedder_dims = 768
-			elif llm_class == 'ChatOllama':
-				self.config.embedder_provider = 'ollama'
-				self.config.embedder_model = 'nomic-embed-text'
-				self.config.embedder_dims = 512
+			embedder = _EMBEDDER_BY_LLM.get(llm.__class__.__name__)
+			if embedder is not None:
+				self.config.embedder_provider, self.config.embedder_model, self.config.embedder_dims = embedder
 		else:
 			# Ensure LLM instance is set in the config
 			self.config = MemoryConfig(config)  # re-validate user-provided config
@@ -64,7 +86,7 @@ class Memory:
 		# Check for required packages
 		try:
 			# also disable mem0's telemetry when ANONYMIZED_TELEMETRY=False
-			if os.getenv('ANONYMIZED_TELEMETRY', 'true').lower()[0] in 'fn0':
+			if os.getenv('ANONYMIZED_TELEMETRY', 'true')[:1].lower() in ('f', 'n', '0'):
 				os.environ['MEM0_TELEMETRY'] = 'False'
 			from mem0 import Memory as Mem0Memory
 		except ImportError:
@@ -78,42 +100,115 @@ class Memory:
 				raise ImportError(
 					'sentence_transformers is required when enable_memory=True and embedder_provider="huggingface". Please install it with `pip install sentence-transformers`.'
 				)
+			if self.config.embedder_quantize:
+				try:
+					# check that the onnx backend is installed if the quantized embedder is requested
+					import optimum.onnxruntime  # noqa: F401
+				except ImportError:
+					raise ImportError(
+						'optimum[onnxruntime] is required when embedder_quantize=True. Please install it with `pip install "sentence-transformers[onnx]"`.'
+					)
 
 		# Initialize Mem0 with the configuration
-		self.mem0 = Mem0Memory.from_config(config_dict=self.config.full_config_dict)
+		config_dict = self.config.full_config_dict
+		if self.config.embedder_provider == 'huggingface' and not self.config.embedder_quantize:
+			config_dict['embedder']['config'].update(self._huggingface_device_kwargs())
+		self.mem0 = Mem0Memory.from_config(config_dict=config_dict)
+		if self.config.embedder_provider == 'huggingface' and self.config.embedder_quantize:
+			self.mem0.embedding_model.model = self._load_quantized_embedder()
+
+	@staticmethod
+	def _huggingface_device_kwargs() -> dict[str, Any]:
+		"""Return mem0 embedder kwargs that run the sentence transformer in fp16 on the GPU, if one is available."""
+		try:
+			import torch
+
+			if torch.cuda.is_available():
+				return {'model_kwargs': {'device': 'cuda', 'model_kwargs': {'torch_dtype': torch.float16}}}
+		except Exception as e:
+			logger.debug(f'CUDA not available for the huggingface embedder: {e}')
+		return {}
+
+	def _load_quantized_embedder(self) -> Any:
+		"""
+		Load the huggingface embedder as a dynamically int8-quantized ONNX model.
+
+		The model is exported and quantized on first use and cached under ~/.cache/browser_use/embedders.
+		"""
+		from sentence_transformers import SentenceTransformer, export_dynamic_quantized_onnx_model
 
-	@time_execution_sync('--create_procedural_memory')
-	def create_procedural_memory(self, current_step: int) -> None:
+		model_name = self.config.embedder_model
+		cache_dir = Path.home() / '.cache' / 'browser_use' / 'embedders' / f'{model_name.replace("/", "--")}-int8'
+		quantized_file = 'onnx/model_qint8_avx512_vnni.onnx'
+
+		if not (cache_dir / quantized_file).exists():
+			logger.info(f'Exporting quantized ONNX embedder for {model_name} to {cache_dir}')
+			model = SentenceTransformer(model_name, backend='onnx')
+			model.save_pretrained(str(cache_dir))
+			export_dynamic_quantized_onnx_model(model, 'avx512_vnni', str(cache_dir))
+
+		return SentenceTransformer(str(cache_dir), backend='onnx', model_kwargs={'file_name': quantized_file})
+
+	@time_execution_async('--create_procedural_memory')
+	async def create_procedural_memory(self, current_step: int) -> None:
 		"""
 		Create a procedural memory if needed based on the current step.
 
+		The message conversion and the mem0 call run in a worker thread, so they don't block the event loop.
+
 		Args:
 		    current_step: The current step number of the agent
 		"""
 		logger.info(f'Creating procedural memory at step {current_step}')
 
-		# Get all messages
-		all_messages = self.message_manager.state.history.messages
+		partitioned = self._partition_messages()
+		if partitioned is None:
+			return
+		new_messages, messages_to_process, removed_tokens = partitioned
 
-		# Separate messages into those to keep as-is and those to process for memory
-		new_messages = []
-		messages_to_process = []
+		memory_content = await asyncio.to_thread(self._create, [m.message for m in messages_to_process], current_step)
+		self._consolidate(new_messages, messages_to_process, removed_tokens, memory_content)
 
-		for msg in all_messages:
-			if isinstance(msg, ManagedMessage) and msg.metadata.message_type in {'init', 'memory'}:
-				# Keep system and memory messages as they are
-				new_messages.append(msg)
-			else:
-				if len(msg.message.content) > 0:
-					messages_to_process.append(msg)
+	@time_execution_sync('--create_procedural_memory_sync')
+	def create_procedural_memory_sync(self, current_step: int) -> None:
+		"""
+		Synchronous variant of `create_procedural_memory`, kept for callers without a running event loop.
 
-		# Need at least 2 messages to create a meaningful summary
-		if len(messages_to_process) <= 1:
-			logger.info('Not enough non-memory messages to summarize')
+		Args:
+		    current_step: The current step number of the agent
+		"""
+		logger.info(f'Creating procedural memory at step {current_step}')
+
+		partitioned = self._partition_messages()
+		if partitioned is None:
 			return
-		# Create a procedural memory
+		new_messages, messages_to_process, removed_tokens = partitioned
+
 		memory_content = self._create([m.message for m in messages_to_process], current_step)
+		self._consolidate(new_messages, messages_to_process, removed_tokens, memory_content)
 
+	def _partition_messages(self) -> Optional[tuple[List[ManagedMessage], List[ManagedMessage], int]]:
+		"""
+		Get the messages to keep as-is, the messages to summarize and their token count, or None if there is nothing to do.
+
+		The split is maintained incrementally by the message history, so this does not rescan it.
+		"""
+		kept_messages, processable_messages, processable_tokens = self.message_manager.state.history.memory_partition()
+
+		# Need at least 2 messages to create a meaningful summary
+		if len(processable_messages) <= 1:
+			logger.info('Not enough non-memory messages to summarize')
+			return None
+		return list(kept_messages), list(processable_messages), processable_tokens
+
+	def _consolidate(
+		self,
+		new_messages: List[ManagedMessage],
+		messages_to_process: List[ManagedMessage],
+		removed_tokens: int,
+		memory_content: Optional[str],
+	) -> None:
+		"""Replace the processed messages in the history with the consolidated memory message."""
 		if not memory_content:
 			logger.warning('Failed to create procedural memory')
 			return
@@ -123,21 +218,22 @@ class Memory:
 		memory_tokens = self.message_manager._count_tokens(memory_message)
 		memory_metadata = MessageMetadata(tokens=memory_tokens, message_type='memory')
 
-		# Calculate the total tokens being removed
-		removed_tokens = sum(m.metadata.tokens for m in messages_to_process)
-
 		# Add the memory message
 		new_messages.append(ManagedMessage(message=memory_message, metadata=memory_metadata))
 
 		# Update the history
-		self.message_manager.state.history.messages = new_messages
-		self.message_manager.state.history.current_tokens -= removed_tokens
-		self.message_manager.state.history.current_tokens += memory_tokens
-		logger.info(f'Messages consolidated: {len(messages_to_process)} messages converted to procedural memory')
+		history = self.message_manager.state.history
+		history.messages = new_messages
+		history.sync_memory_partition()
+		# the empty messages dropped on consolidation still count towards the total, so recount the few kept messages
+		history.current_tokens = sum(m.metadata.tokens for m in new_messages)
+		logger.info(
+			f'Messages consolidated: {len(messages_to_process)} messages ({removed_tokens} tokens) converted to procedural memory'
+		)
 
 	def _create(self, messages: List[BaseMessage], current_step: int) -> Optional[str]:
-		parsed_messages = convert_to_openai_messages(messages)
 		try:
+			parsed_messages = _to_openai_messages(messages)
 			results = self.mem0.add(
 				messages=parsed_messages,
 				agent_id=self.config.agent_id,
@@ -19,6 +19,7 @@ class MemoryConfig(BaseModel):
 	embedder_provider: Literal['openai', 'gemini', 'ollama', 'huggingface'] = 'huggingface'
 	embedder_model: str = Field(min_length=2, default='all-MiniLM-L6-v2')
 	embedder_dims: int = Field(default=384, gt=10, lt=10000)
+	embedder_quantize: bool = False  # huggingface only: run the embedder as an int8-quantized ONNX model
 
 	# LLM settings - the LLM instance can be passed separately
 	llm_provider: Literal['langchain'] = 'langchain'
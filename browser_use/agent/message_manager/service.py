@@ -14,7 +14,7 @@ from pydantic import BaseModel
 
 from browser_use.agent.message_manager.views import MessageMetadata
 from browser_use.agent.prompts import AgentMessagePrompt
-from browser_use.agent.views import ActionResult, AgentOutput, AgentStepInfo, MessageManagerState
+from browser_use.agent.views import ActionResult, AgentOutput, AgentStepInfo, MessageManagerState, ScreenshotQuality
 from browser_use.browser.views import BrowserState
 from browser_use.utils import time_execution_sync
 
@@ -26,6 +26,8 @@ class MessageManagerSettings(BaseModel):
 	estimated_characters_per_token: int = 3
 	image_tokens: int = 800
 	include_attributes: list[str] = []
+	screenshot_quality: Optional[ScreenshotQuality] = None
+	minimal_attrs: bool = False
 	message_context: Optional[str] = None
 	sensitive_data: Optional[Dict[str, str]] = None
 	available_file_paths: Optional[List[str]] = None
@@ -43,6 +45,8 @@ class MessageManager:
 		self.settings = settings
 		self.state = state
 		self.system_prompt = system_message
+		# rendered element subtrees of the previous state, most of the page is unchanged between two steps
+		self._element_render_cache: dict = {}
 
 		# Only initialize messages if state is empty
 		if len(self.state.history.messages) == 0:
@@ -152,6 +156,9 @@ class MessageManager:
 			result,
 			include_attributes=self.settings.include_attributes,
 			step_info=step_info,
+			element_render_cache=self._element_render_cache,
+			screenshot_quality=self.settings.screenshot_quality,
+			minimal_attrs=self.settings.minimal_attrs,
 		).get_user_message(use_vision)
 		self._add_message_with_tokens(state_message)
 
@@ -277,6 +284,8 @@ class MessageManager:
 					text += item['text']
 			msg.message.content = text
 			self.state.history.messages[-1] = msg
+			# token counts of the last message changed in place
+			self.state.history.sync_memory_partition()
 
 		if diff <= 0:
 			return None
@@ -44,6 +44,35 @@ def extract_json_from_model_output(content: str) -> dict:
 		raise ValueError('Could not parse response.')
 
 
+def find_json_object_end(content: str) -> Optional[int]:
+	"""Return the index just past the first complete top-level JSON object in content, or None if it is not complete yet."""
+	start = content.find('{')
+	if start == -1:
+		return None
+
+	depth = 0
+	in_string = False
+	escaped = False
+	for i in range(start, len(content)):
+		char = content[i]
+		if in_string:
+			if escaped:
+				escaped = False
+			elif char == '\\':
+				escaped = True
+			elif char == '"':
+				in_string = False
+		elif char == '"':
+			in_string = True
+		elif char == '{':
+			depth += 1
+		elif char == '}':
+			depth -= 1
+			if depth == 0:
+				return i + 1
+	return None
+
+
 def convert_input_messages(input_messages: list[BaseMessage], model_name: Optional[str]) -> list[BaseMessage]:
 	"""Convert input messages to a format that is compatible with the planner model"""
 	if model_name is None:
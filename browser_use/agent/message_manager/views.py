@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+from collections import deque
+from enum import IntEnum
 from typing import TYPE_CHECKING, Any
 from warnings import filterwarnings
 
 from langchain_core._api import LangChainBetaWarning
 from langchain_core.load import dumpd, load
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage, ToolMessage
-from pydantic import BaseModel, ConfigDict, Field, model_serializer, model_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_serializer, model_validator
 
 filterwarnings('ignore', category=LangChainBetaWarning)
 
@@ -14,6 +16,20 @@ if TYPE_CHECKING:
 	from browser_use.agent.views import AgentOutput
 
 
+class MType(IntEnum):
+	"""Message type tag as an int, so partitioning the history is a single int comparison"""
+
+	INIT = 0
+	MEMORY = 1
+	OTHER = 2
+
+
+# message types up to this one are kept as-is when the history is consolidated into procedural memory
+KEEP_MAX = MType.MEMORY
+
+_MTYPE_BY_MESSAGE_TYPE = {'init': MType.INIT, 'memory': MType.MEMORY}
+
+
 class MessageMetadata(BaseModel):
 	"""Metadata for a message"""
 
@@ -29,6 +45,12 @@ class ManagedMessage(BaseModel):
 
 	model_config = ConfigDict(arbitrary_types_allowed=True)
 
+	# precomputed from metadata.message_type
+	_mtype: MType = PrivateAttr(default=MType.OTHER)
+
+	def model_post_init(self, __context: Any) -> None:
+		self._mtype = _MTYPE_BY_MESSAGE_TYPE.get(self.metadata.message_type, MType.OTHER)
+
 	# https://github.com/pydantic/pydantic/discussions/7558
 	@model_serializer(mode='wrap')
 	def to_json(self, original_dump):
@@ -74,12 +96,74 @@ class MessageHistory(BaseModel):
 
 	model_config = ConfigDict(arbitrary_types_allowed=True)
 
+	# Split of the history used by procedural memory, kept up to date as messages are added/removed:
+	# messages that are kept as-is on consolidation and messages that get summarized (plus their tokens)
+	_kept_messages: deque[ManagedMessage] = PrivateAttr(default_factory=deque)
+	_processable_messages: deque[ManagedMessage] = PrivateAttr(default_factory=deque)
+	_processable_tokens: int = PrivateAttr(default=0)
+
+	def model_post_init(self, __context: Any) -> None:
+		self.sync_memory_partition()
+
+	def _memory_bucket(self, msg: ManagedMessage) -> deque[ManagedMessage] | None:
+		"""Partition a message belongs to, None for empty messages which are dropped on consolidation"""
+		if msg._mtype <= KEEP_MAX:
+			return self._kept_messages
+		if len(msg.message.content) > 0:
+			return self._processable_messages
+		return None
+
+	def _track(self, msg: ManagedMessage, position: int | None = None) -> None:
+		"""Add a message that was just inserted into `messages` to its partition"""
+		bucket = self._memory_bucket(msg)
+		if bucket is None:
+			return
+
+		if position is None:
+			bucket.append(msg)
+		else:
+			index = len(self.messages) - 1 + position if position < 0 else position
+			if index <= 0:
+				self.sync_memory_partition()
+				return
+			# count the messages of the same partition behind the inserted one to find its slot
+			behind = sum(1 for m in self.messages[index + 1 :] if self._memory_bucket(m) is bucket)
+			bucket.insert(len(bucket) - behind, msg)
+
+		if bucket is self._processable_messages:
+			self._processable_tokens += msg.metadata.tokens
+
+	def sync_memory_partition(self) -> None:
+		"""Rebuild the memory partition from scratch, needed after modifying `messages` directly"""
+		kept_messages: deque[ManagedMessage] = deque()
+		processable_messages: deque[ManagedMessage] = deque()
+		processable_tokens = 0
+
+		keep = kept_messages.append
+		process = processable_messages.append
+		for msg in self.messages:
+			if msg._mtype <= KEEP_MAX:
+				keep(msg)
+			elif len(msg.message.content) > 0:
+				process(msg)
+				processable_tokens += msg.metadata.tokens
+
+		self._kept_messages = kept_messages
+		self._processable_messages = processable_messages
+		self._processable_tokens = processable_tokens
+
+	def memory_partition(self) -> tuple[deque[ManagedMessage], deque[ManagedMessage], int]:
+		"""Get the messages to keep, the messages to summarize and the token count of the latter"""
+		return self._kept_messages, self._processable_messages, self._processable_tokens
+
 	def add_message(self, message: BaseMessage, metadata: MessageMetadata, position: int | None = None) -> None:
 		"""Add message with metadata to history"""
+		managed_message = ManagedMessage(message=message, metadata=metadata)
 		if position is None:
-			self.messages.append(ManagedMessage(message=message, metadata=metadata))
+			self.messages.append(managed_message)
 		else:
-			self.messages.insert(position, ManagedMessage(message=message, metadata=metadata))
+			self.messages.insert(position, managed_message)
+		self._track(managed_message, position)
 		self.current_tokens += metadata.tokens
 
 	def add_model_output(self, output: 'AgentOutput') -> None:
@@ -117,13 +201,21 @@ class MessageHistory(BaseModel):
 			if not isinstance(msg.message, SystemMessage):
 				self.current_tokens -= msg.metadata.tokens
 				self.messages.pop(i)
+				self.sync_memory_partition()
 				break
 
 	def remove_last_state_message(self) -> None:
 		"""Remove last state message from history"""
 		if len(self.messages) > 2 and isinstance(self.messages[-1].message, HumanMessage):
 			self.current_tokens -= self.messages[-1].metadata.tokens
-			self.messages.pop()
+			msg = self.messages.pop()
+			bucket = self._memory_bucket(msg)
+			if bucket and bucket[-1] is msg:
+				bucket.pop()
+				if bucket is self._processable_messages:
+					self._processable_tokens -= msg.metadata.tokens
+			elif bucket is not None:
+				self.sync_memory_partition()
 
 
 class MessageManagerState(BaseModel):
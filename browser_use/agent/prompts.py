@@ -1,13 +1,33 @@
+import base64
 import importlib.resources
+import io
 from datetime import datetime
-from typing import TYPE_CHECKING, List, Optional, Union
+from typing import TYPE_CHECKING, Collection, List, Optional, Union
 
 from langchain_core.messages import HumanMessage, SystemMessage
 
 if TYPE_CHECKING:
-	from browser_use.agent.views import ActionResult, AgentStepInfo
+	from browser_use.agent.views import ActionResult, AgentStepInfo, ScreenshotQuality
 	from browser_use.browser.views import BrowserState
 
+# Longest side of the screenshot sent to the model per screenshot_quality
+SCREENSHOT_MAX_SIZE = {'low': 1024, 'high': 2048}
+
+
+def compress_screenshot(screenshot: str, quality: 'ScreenshotQuality') -> str:
+	"""Downscale a base64 PNG screenshot and re-encode it as a base64 JPEG (quality 80)"""
+	try:
+		from PIL import Image
+	except ImportError:
+		raise ImportError('Pillow is required when screenshot_quality is set. Please install it with `pip install pillow`.')
+
+	max_size = SCREENSHOT_MAX_SIZE[quality]
+	image = Image.open(io.BytesIO(base64.b64decode(screenshot))).convert('RGB')
+	image.thumbnail((max_size, max_size))
+	buffer = io.BytesIO()
+	image.save(buffer, 'JPEG', quality=80, optimize=True)
+	return base64.b64encode(buffer.getvalue()).decode('utf-8')
+
 
 class SystemPrompt:
 	def __init__(
@@ -64,16 +84,26 @@ class AgentMessagePrompt:
 		self,
 		state: 'BrowserState',
 		result: Optional[List['ActionResult']] = None,
-		include_attributes: list[str] | None = None,
+		include_attributes: Collection[str] | None = None,
 		step_info: Optional['AgentStepInfo'] = None,
+		element_render_cache: Optional[dict] = None,
+		screenshot_quality: Optional['ScreenshotQuality'] = None,
+		minimal_attrs: bool = False,
 	):
 		self.state = state
 		self.result = result
 		self.include_attributes = include_attributes or []
 		self.step_info = step_info
+		self.element_render_cache = element_render_cache
+		self.screenshot_quality = screenshot_quality
+		self.minimal_attrs = minimal_attrs
 
 	def get_user_message(self, use_vision: bool = True) -> HumanMessage:
-		elements_text = self.state.element_tree.clickable_elements_to_string(include_attributes=self.include_attributes)
+		elements_text = self.state.element_tree.clickable_elements_to_string(
+			include_attributes=self.include_attributes,
+			render_cache=self.element_render_cache,
+			minimal_attrs=self.minimal_attrs,
+		)
 
 		has_content_above = (self.state.pixels_above or 0) > 0
 		has_content_below = (self.state.pixels_below or 0) > 0
@@ -123,13 +153,18 @@ Interactive elements from top layer of the current page inside the viewport:
 					state_description += f'\nAction error {i + 1}/{len(self.result)}: ...{error}'
 
 		if self.state.screenshot and use_vision is True:
+			# the state keeps the original PNG for the history and the GIF, only the copy sent to the model is compressed
+			if self.screenshot_quality:
+				image_url = f'data:image/jpeg;base64,{compress_screenshot(self.state.screenshot, self.screenshot_quality)}'
+			else:
+				image_url = f'data:image/png;base64,{self.state.screenshot}'
 			# Format message for vision model
 			return HumanMessage(
 				content=[
 					{'type': 'text', 'text': state_description},
 					{
 						'type': 'image_url',
-						'image_url': {'url': f'data:image/png;base64,{self.state.screenshot}'},  # , 'detail': 'low'
+						'image_url': {'url': image_url},  # , 'detail': 'low'
 					},
 				]
 			)
@@ -9,15 +9,17 @@ import os
 import re
 import time
 from pathlib import Path
-from typing import Any, Awaitable, Callable, Dict, Generic, List, Optional, TypeVar, Union
+from typing import Any, Awaitable, Callable, Dict, Generic, List, Optional, Type, TypeVar, Union
 
 from dotenv import load_dotenv
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.messages import (
+	AIMessage,
 	BaseMessage,
 	HumanMessage,
 	SystemMessage,
 )
+from langchain_core.runnables import Runnable
 
 # from lmnr.sdk.decorators import observe
 from pydantic import BaseModel, ValidationError
@@ -29,6 +31,7 @@ from browser_use.agent.message_manager.service import MessageManager, MessageMan
 from browser_use.agent.message_manager.utils import (
 	convert_input_messages,
 	extract_json_from_model_output,
+	find_json_object_end,
 	is_model_without_tool_support,
 	save_conversation,
 )
@@ -43,6 +46,7 @@ from browser_use.agent.views import (
 	AgentSettings,
 	AgentState,
 	AgentStepInfo,
+	ScreenshotQuality,
 	StepMetadata,
 	ToolCallingMethod,
 )
@@ -51,6 +55,7 @@ from browser_use.browser.context import BrowserContext
 from browser_use.browser.views import BrowserState, BrowserStateHistory
 from browser_use.controller.registry.views import ActionModel
 from browser_use.controller.service import Controller
+from browser_use.controller.views import DoneAction
 from browser_use.dom.history_tree_processor.service import (
 	DOMHistoryElement,
 	HistoryTreeProcessor,
@@ -62,7 +67,7 @@ from browser_use.telemetry.views import (
 	AgentRunTelemetryEvent,
 	AgentStepTelemetryEvent,
 )
-from browser_use.utils import check_env_variables, time_execution_async, time_execution_sync
+from browser_use.utils import SignalHandler, check_env_variables, time_execution_async, time_execution_sync
 
 load_dotenv()
 logger = logging.getLogger(__name__)
@@ -88,6 +93,7 @@ def log_response(response: AgentOutput) -> None:
 
 
 Context = TypeVar('Context')
+T = TypeVar('T')
 
 AgentHookFunc = Callable[['Agent'], Awaitable[None]]
 
@@ -120,6 +126,7 @@ class Agent(Generic[Context]):
 		# Agent settings
 		use_vision: bool = True,
 		use_vision_for_planner: bool = False,
+		screenshot_quality: Optional[ScreenshotQuality] = None,
 		save_conversation_path: Optional[str] = None,
 		save_conversation_path_encoding: Optional[str] = 'utf-8',
 		max_failures: int = 3,
@@ -143,6 +150,7 @@ class Agent(Generic[Context]):
 			'aria-expanded',
 			'data-date-format',
 		],
+		minimal_attrs: bool = False,
 		max_actions_per_step: int = 10,
 		tool_calling_method: Optional[ToolCallingMethod] = 'auto',
 		page_extraction_llm: Optional[BaseChatModel] = None,
@@ -170,6 +178,7 @@ class Agent(Generic[Context]):
 		self.settings = AgentSettings(
 			use_vision=use_vision,
 			use_vision_for_planner=use_vision_for_planner,
+			screenshot_quality=screenshot_quality,
 			save_conversation_path=save_conversation_path,
 			save_conversation_path_encoding=save_conversation_path_encoding,
 			max_failures=max_failures,
@@ -182,6 +191,7 @@ class Agent(Generic[Context]):
 			generate_gif=generate_gif,
 			available_file_paths=available_file_paths,
 			include_attributes=include_attributes,
+			minimal_attrs=minimal_attrs,
 			max_actions_per_step=max_actions_per_step,
 			tool_calling_method=tool_calling_method,
 			page_extraction_llm=page_extraction_llm,
@@ -206,6 +216,7 @@ class Agent(Generic[Context]):
 		# Model setup
 		self._set_model_names()
 		self.tool_calling_method = self._set_tool_calling_method()
+		self._structured_llms: dict[Type[AgentOutput], Runnable] = {}
 
 		# Handle users trying to use use_vision=True with DeepSeek models
 		if 'deepseek' in self.model_name.lower():
@@ -228,6 +239,7 @@ class Agent(Generic[Context]):
 			f'🧠 Starting an agent with main_model={self.model_name}'
 			f'{" +tools" if self.tool_calling_method == "function_calling" else ""}'
 			f'{" +rawtools" if self.tool_calling_method == "raw" else ""}'
+			f'{" +schema" if self.tool_calling_method == "json_schema" else ""}'
 			f'{" +vision" if self.settings.use_vision else ""}'
 			f'{" +memory" if self.enable_memory else ""}, '
 			f'planner_model={self.planner_model_name}'
@@ -258,6 +270,8 @@ class Agent(Generic[Context]):
 			settings=MessageManagerSettings(
 				max_input_tokens=self.settings.max_input_tokens,
 				include_attributes=self.settings.include_attributes,
+				screenshot_quality=self.settings.screenshot_quality,
+				minimal_attrs=self.settings.minimal_attrs,
 				message_context=self.settings.message_context,
 				sensitive_data=sensitive_data,
 				available_file_paths=self.settings.available_file_paths,
@@ -394,6 +408,12 @@ class Agent(Generic[Context]):
 	def add_new_task(self, new_task: str) -> None:
 		self._message_manager.add_new_task(new_task)
 
+	async def _run_interruptible(self, coro: Awaitable[T], name: str) -> T:
+		"""Run a coroutine as a task that the Ctrl+C signal handler can cancel directly"""
+		task = SignalHandler.register_task(asyncio.ensure_future(coro))
+		task.set_name(name)
+		return await task
+
 	async def _raise_if_stopped_or_paused(self) -> None:
 		"""Utility function that raises an InterruptedError if the agent is stopped or paused."""
 
@@ -422,7 +442,7 @@ class Agent(Generic[Context]):
 
 			# generate procedural memory if needed
 			if self.enable_memory and self.memory and self.state.n_steps % self.memory.config.memory_interval == 0:
-				self.memory.create_procedural_memory(self.state.n_steps)
+				await self.memory.create_procedural_memory(self.state.n_steps)
 
 			await self._raise_if_stopped_or_paused()
 
@@ -476,7 +496,7 @@ class Agent(Generic[Context]):
 			tokens = self._message_manager.state.history.current_tokens
 
 			try:
-				model_output = await self.get_next_action(input_messages)
+				model_output = await self._run_interruptible(self.get_next_action(input_messages), name='get_next_action')
 				if (
 					not model_output.action
 					or not isinstance(model_output.action, list)
@@ -489,15 +509,15 @@ class Agent(Generic[Context]):
 					)
 
 					retry_messages = input_messages + [clarification_message]
-					model_output = await self.get_next_action(retry_messages)
+					model_output = await self._run_interruptible(self.get_next_action(retry_messages), name='get_next_action')
 
 					if not model_output.action or all(action.model_dump() == {} for action in model_output.action):
 						logger.warning('Model still returned empty after retry. Inserting safe noop action.')
-						action_instance = self.ActionModel(
-							done={
-								'success': False,
-								'text': 'No next action returned by LLM!',
-							}
+						action_instance = self.ActionModel.model_construct(
+							done=DoneAction.make(
+								success=False,
+								text='No next action returned by LLM!',
+							)
 						)
 						model_output.action = [action_instance]
 
@@ -667,6 +687,26 @@ class Agent(Generic[Context]):
 		text = re.sub(self.STRAY_CLOSE_TAG, '', text)
 		return text.strip()
 
+	async def _astream_json_output(self, input_messages: list[BaseMessage]) -> AIMessage:
+		"""Stream a raw completion and stop reading as soon as the first JSON object in it is complete"""
+		content = ''
+		stream = self.llm.astream(input_messages)
+		try:
+			async for chunk in stream:
+				content += chunk.text()
+				# braces inside <think> reasoning don't count, only look for the JSON after it
+				if '<think>' in content and '</think>' not in content:
+					continue
+				visible = content.rsplit('</think>', 1)[-1]
+				json_end = find_json_object_end(visible)
+				if json_end is not None:
+					# drop anything the model writes after the action JSON instead of waiting for it
+					content = content[: len(content) - len(visible) + json_end]
+					break
+		finally:
+			await stream.aclose()  # type: ignore[attr-defined]
+		return AIMessage(content=content)
+
 	def _convert_input_messages(self, input_messages: list[BaseMessage]) -> list[BaseMessage]:
 		"""Convert input messages to the correct format"""
 		if is_model_without_tool_support(self.model_name):
@@ -674,6 +714,17 @@ class Agent(Generic[Context]):
 		else:
 			return input_messages
 
+	def _get_structured_llm(self, output_model: Type[AgentOutput]) -> Runnable:
+		"""Get the structured output LLM for an output model, the tool schema is only converted the first time"""
+		if output_model not in self._structured_llms:
+			if self.tool_calling_method is None:
+				self._structured_llms[output_model] = self.llm.with_structured_output(output_model, include_raw=True)
+			else:
+				self._structured_llms[output_model] = self.llm.with_structured_output(
+					output_model, include_raw=True, method=self.tool_calling_method
+				)
+		return self._structured_llms[output_model]
+
 	@time_execution_async('--get_next_action (agent)')
 	async def get_next_action(self, input_messages: list[BaseMessage]) -> AgentOutput:
 		"""Get next action from LLM based on current state"""
@@ -682,7 +733,7 @@ class Agent(Generic[Context]):
 		if self.tool_calling_method == 'raw':
 			logger.debug(f'Using {self.tool_calling_method} for {self.chat_model_library}')
 			try:
-				output = self.llm.invoke(input_messages)
+				output = await self._astream_json_output(input_messages)
 				response = {'raw': output, 'parsed': None}
 			except Exception as e:
 				logger.error(f'Failed to invoke model: {str(e)}')
@@ -698,7 +749,7 @@ class Agent(Generic[Context]):
 				raise ValueError('Could not parse response.')
 
 		elif self.tool_calling_method is None:
-			structured_llm = self.llm.with_structured_output(self.AgentOutput, include_raw=True)
+			structured_llm = self._get_structured_llm(self.AgentOutput)
 			try:
 				response: dict[str, Any] = await structured_llm.ainvoke(input_messages)  # type: ignore
 				parsed: AgentOutput | None = response['parsed']
@@ -709,7 +760,7 @@ class Agent(Generic[Context]):
 
 		else:
 			logger.debug(f'Using {self.tool_calling_method} for {self.chat_model_library}')
-			structured_llm = self.llm.with_structured_output(self.AgentOutput, include_raw=True, method=self.tool_calling_method)
+			structured_llm = self._get_structured_llm(self.AgentOutput)
 			response: dict[str, Any] = await structured_llm.ainvoke(input_messages)  # type: ignore
 
 		# Handle tool call responses
@@ -800,15 +851,22 @@ class Agent(Generic[Context]):
 	# @observe(name='agent.run', ignore_output=True)
 	@time_execution_async('--run (agent)')
 	async def run(
-		self, max_steps: int = 100, on_step_start: AgentHookFunc | None = None, on_step_end: AgentHookFunc | None = None
+		self,
+		max_steps: int = 100,
+		on_step_start: AgentHookFunc | None = None,
+		on_step_end: AgentHookFunc | None = None,
+		until: Callable[[AgentHistoryList], bool] | None = None,
 	) -> AgentHistoryList:
-		"""Execute the task with maximum number of steps"""
+		"""
+		Execute the task with maximum number of steps
+
+		until: optional predicate checked on the history after every step that did not finish the task,
+		the run stops early once it returns True
+		"""
 
 		loop = asyncio.get_event_loop()
 
 		# Set up the Ctrl+C signal handler with callbacks specific to this agent
-		from browser_use.utils import SignalHandler
-
 		signal_handler = SignalHandler(
 			loop=loop,
 			pause_callback=self.pause,
@@ -863,6 +921,12 @@ class Agent(Generic[Context]):
 
 					await self.log_completion()
 					break
+
+				# an early stop goes through the same completion handling as a done task
+				if until is not None and until(self.state.history):
+					logger.info('✅ Stopping early, the until condition is met')
+					await self.log_completion()
+					break
 			else:
 				error_message = 'Failed to complete task in maximum steps'
 
@@ -958,13 +1022,16 @@ class Agent(Generic[Context]):
 			try:
 				await self._raise_if_stopped_or_paused()
 
-				result = await self.controller.act(
-					action,
-					self.browser_context,
-					self.settings.page_extraction_llm,
-					self.sensitive_data,
-					self.settings.available_file_paths,
-					context=self.context,
+				result = await self._run_interruptible(
+					self.controller.act(
+						action,
+						self.browser_context,
+						self.settings.page_extraction_llm,
+						self.sensitive_data,
+						self.settings.available_file_paths,
+						context=self.context,
+					),
+					name='multi_act',
 				)
 
 				results.append(result)
@@ -1005,6 +1072,8 @@ class Agent(Generic[Context]):
 				state=state,
 				result=self.state.last_result,
 				include_attributes=self.settings.include_attributes,
+				screenshot_quality=self.settings.screenshot_quality,
+				minimal_attrs=self.settings.minimal_attrs,
 			)
 			msg = [SystemMessage(content=system_msg), content.get_user_message(self.settings.use_vision)]
 		else:
@@ -4,8 +4,10 @@ import json
 import traceback
 import uuid
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import zip_longest
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Type
+from typing import Any, Dict, Iterator, List, Literal, Optional, Type
 
 from langchain_core.language_models.chat_models import BaseChatModel
 from openai import RateLimitError
@@ -21,7 +23,9 @@ from browser_use.dom.history_tree_processor.service import (
 )
 from browser_use.dom.views import SelectorMap
 
-ToolCallingMethod = Literal['function_calling', 'json_mode', 'raw', 'auto']
+# json_schema: OpenAI / Azure OpenAI structured outputs, the response is constrained to the AgentOutput schema
+ToolCallingMethod = Literal['function_calling', 'json_mode', 'json_schema', 'raw', 'auto']
+ScreenshotQuality = Literal['low', 'high']
 REQUIRED_LLM_API_ENV_VARS = {
 	'ChatOpenAI': ['OPENAI_API_KEY'],
 	'AzureChatOpenAI': ['AZURE_OPENAI_ENDPOINT', 'AZURE_OPENAI_KEY'],
@@ -39,6 +43,8 @@ class AgentSettings(BaseModel):
 
 	use_vision: bool = True
 	use_vision_for_planner: bool = False
+	screenshot_quality: Optional[ScreenshotQuality] = None
+	minimal_attrs: bool = False
 	save_conversation_path: Optional[str] = None
 	save_conversation_path_encoding: Optional[str] = 'utf-8'
 	max_failures: int = 3
@@ -148,8 +154,9 @@ class AgentOutput(BaseModel):
 	)
 
 	@staticmethod
+	@lru_cache(maxsize=128)
 	def type_with_custom_actions(custom_actions: Type[ActionModel]) -> Type['AgentOutput']:
-		"""Extend actions with custom actions"""
+		"""Extend actions with custom actions (cached, the registry hands out the same action model for the same actions)"""
 		model_ = create_model(
 			'AgentOutput',
 			__base__=AgentOutput,
@@ -328,9 +335,9 @@ class AgentHistoryList(BaseModel):
 		"""Get all action names from history"""
 		action_names = []
 		for action in self.model_actions():
-			actions = list(action.keys())
-			if actions:
-				action_names.append(actions[0])
+			action_name = next(iter(action), None)
+			if action_name is not None:
+				action_names.append(action_name)
 		return action_names
 
 	def model_thoughts(self) -> list[AgentBrain]:
@@ -354,6 +361,23 @@ class AgentHistoryList(BaseModel):
 					outputs.append(output)
 		return outputs
 
+	def iter_actions_and_content(self) -> Iterator[tuple[Optional[dict], Optional[str]]]:
+		"""
+		Get (action, extracted content) pairs from history in a single pass.
+
+		The action is shaped like the entries of `model_actions()`. Either side is None when a step has more
+		actions than results or the other way round, e.g. when the remaining actions of a step were not executed.
+		"""
+		for h in self.history:
+			actions = []
+			if h.model_output:
+				for action, interacted_element in zip(h.model_output.action, h.state.interacted_element):
+					output = action.model_dump(exclude_none=True)
+					output['interacted_element'] = interacted_element
+					actions.append(output)
+			for action, result in zip_longest(actions, h.result):
+				yield action, result.extracted_content if result else None
+
 	def action_results(self) -> list[ActionResult]:
 		"""Get all results from history"""
 		results = []
@@ -376,7 +400,7 @@ class AgentHistoryList(BaseModel):
 		result = []
 		for o in outputs:
 			for i in include:
-				if i == list(o.keys())[0]:
+				if i == next(iter(o)):
 					result.append(o)
 		return result
 
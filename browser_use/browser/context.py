@@ -12,7 +12,7 @@ import re
 import time
 import uuid
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Literal, Optional
 
 import anyio
 from patchright._impl._errors import TimeoutError
@@ -24,6 +24,7 @@ from patchright.async_api import (
 	ElementHandle,
 	FrameLocator,
 	Page,
+	Route,
 )
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -51,6 +52,9 @@ BROWSER_NAVBAR_HEIGHT = {
 	'linux': 90,
 }.get(platform.system().lower(), 85)
 
+# Resource types aborted when BrowserContextConfig.block_resources is set
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media', 'stylesheet'})
+
 
 class BrowserContextWindowSize(BaseModel):
 	"""Window size configuration for browser context"""
@@ -93,6 +97,10 @@ class BrowserContextConfig(BaseModel):
 	    maximum_wait_page_load_time: 5.0
 	        Maximum time to wait for page load before proceeding anyway
 
+	    wait_until: 'load'
+	        Load state that navigations, clicks and screenshots wait for. 'domcontentloaded' doesn't wait for images,
+	        fonts and subframes, which saves time on pages that keep loading resources in the background
+
 	    wait_between_actions: 1.0
 	        Time to wait between multiple per step actions
 
@@ -151,6 +159,9 @@ class BrowserContextConfig(BaseModel):
 
 		force_new_context: False
 			Forces a new browser context to be created. Useful when running locally with branded browser (e.g Chrome, Edge) and setting a custom config.
+
+		block_resources: False
+			Abort image, font, media and stylesheet requests. Useful for text-only tasks to cut page load bytes, but pages will look unstyled in screenshots (use_vision).
 	"""
 
 	model_config = ConfigDict(
@@ -166,6 +177,7 @@ class BrowserContextConfig(BaseModel):
 	minimum_wait_page_load_time: float = 0.25
 	wait_for_network_idle_page_load_time: float = 0.5
 	maximum_wait_page_load_time: float = 5
+	wait_until: Literal['load', 'domcontentloaded'] = 'load'
 	wait_between_actions: float = 0.5
 
 	disable_security: bool = False  # disable_security=True is dangerous as any malicious URL visited could embed an iframe for the user's bank, and use their cookies to steal money
@@ -196,6 +208,7 @@ class BrowserContextConfig(BaseModel):
 	timezone_id: str | None = None
 
 	force_new_context: bool = False
+	block_resources: bool = False
 
 
 @dataclass
@@ -426,7 +439,7 @@ class BrowserContext:
 		async def on_page(page: Page):
 			if self.browser.config.cdp_url:
 				await page.reload()  # Reload the page to avoid timeout errors
-			await page.wait_for_load_state()
+			await page.wait_for_load_state(self.config.wait_until)
 			logger.debug(f'📑  New page opened: {page.url}')
 
 			if not page.url.startswith('chrome-extension://') and not page.url.startswith('chrome://'):
@@ -504,6 +517,9 @@ class BrowserContext:
 		if self.config.trace_path:
 			await context.tracing.start(screenshots=True, snapshots=True, sources=True)
 
+		if self.config.block_resources:
+			await context.route('**/*', self._block_resource_route)
+
 		# Resize the window for non-headless mode
 		if not self.browser.config.headless and not self.config.no_viewport:
 			await self._resize_window(context)
@@ -544,6 +560,14 @@ class BrowserContext:
 
 		return context
 
+	@staticmethod
+	async def _block_resource_route(route: Route) -> None:
+		"""Abort requests for resources that are not needed to read the page content"""
+		if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+			await route.abort()
+		else:
+			await route.continue_()
+
 	async def _set_viewport_size_for_page(self, page: Page) -> None:
 		"""Helper method to set viewport size for a page"""
 		try:
@@ -796,14 +820,14 @@ class BrowserContext:
 			raise BrowserError(f'Navigation to non-allowed URL: {url}')
 
 		page = await self.get_current_page()
-		await page.goto(url)
-		await page.wait_for_load_state()
+		await page.goto(url, wait_until=self.config.wait_until)
+		await page.wait_for_load_state(self.config.wait_until)
 
 	async def refresh_page(self):
 		"""Refresh the current page"""
 		page = await self.get_current_page()
-		await page.reload()
-		await page.wait_for_load_state()
+		await page.reload(wait_until=self.config.wait_until)
+		await page.wait_for_load_state(self.config.wait_until)
 
 	async def go_back(self):
 		"""Navigate back in history"""
@@ -989,7 +1013,14 @@ class BrowserContext:
 				highlight_elements=self.config.highlight_elements,
 			)
 
-			tabs_info = await self.get_tabs_info()
+			# The rest only reads the page once the highlights are drawn, so the screenshot (the slowest part) overlaps
+			# with the tab titles and scroll info instead of running after them
+			tabs_info, screenshot_b64, (pixels_above, pixels_below), title = await asyncio.gather(
+				self.get_tabs_info(),
+				self.take_screenshot(),
+				self.get_scroll_info(page),
+				page.title(),
+			)
 
 			# Get all cross-origin iframes within the page and open them in new tabs
 			# mark the titles of the new tabs so the LLM knows to check them for additional content
@@ -1011,14 +1042,11 @@ class BrowserContext:
 			# 		)
 			# 	)
 
-			screenshot_b64 = await self.take_screenshot()
-			pixels_above, pixels_below = await self.get_scroll_info(page)
-
 			self.current_state = BrowserState(
 				element_tree=content.element_tree,
 				selector_map=content.selector_map,
 				url=page.url,
-				title=await page.title(),
+				title=title,
 				tabs=tabs_info,
 				screenshot=screenshot_b64,
 				pixels_above=pixels_above,
@@ -1042,7 +1070,7 @@ class BrowserContext:
 		page = await self.get_current_page()
 
 		await page.bring_to_front()
-		await page.wait_for_load_state()
+		await page.wait_for_load_state(self.config.wait_until)
 
 		screenshot = await page.screenshot(
 			full_page=full_page,
@@ -1462,12 +1490,12 @@ class BrowserContext:
 					except TimeoutError:
 						# If no download is triggered, treat as normal click
 						logger.debug('No download triggered within timeout. Checking navigation...')
-						await page.wait_for_load_state()
+						await page.wait_for_load_state(self.config.wait_until)
 						await self._check_and_handle_navigation(page)
 				else:
 					# Standard click logic if no download is expected
 					await click_func()
-					await page.wait_for_load_state()
+					await page.wait_for_load_state(self.config.wait_until)
 					await self._check_and_handle_navigation(page)
 
 			try:
@@ -1530,7 +1558,7 @@ class BrowserContext:
 
 		self.active_tab = page
 		await page.bring_to_front()
-		await page.wait_for_load_state()
+		await page.wait_for_load_state(self.config.wait_until)
 
 		# Set the viewport size for the tab
 		try:
@@ -1550,7 +1578,7 @@ class BrowserContext:
 
 		self.active_tab = new_page
 
-		await new_page.wait_for_load_state()
+		await new_page.wait_for_load_state(self.config.wait_until)
 
 		# Set the viewport size for the new tab
 		try:
@@ -1560,7 +1588,7 @@ class BrowserContext:
 			logger.debug(f'Failed to set viewport size: {e}')
 
 		if url:
-			await new_page.goto(url)
+			await new_page.goto(url, wait_until=self.config.wait_until)
 			await self._wait_for_page_and_frames_load(timeout_overwrite=1)
 
 		# Get target ID for new page if using CDP
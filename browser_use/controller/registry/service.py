@@ -28,6 +28,8 @@ class Registry(Generic[Context]):
 		self.registry = ActionRegistry()
 		self.telemetry = ProductTelemetry()
 		self.exclude_actions = exclude_actions if exclude_actions is not None else []
+		# action models by the names of the actions they contain, the agent asks for one per step
+		self._action_models: dict[tuple[str, ...], Type[ActionModel]] = {}
 
 	# @time_execution_sync('--create_param_model')
 	def _create_param_model(self, function: Callable) -> Type[BaseModel]:
@@ -85,6 +87,7 @@ class Registry(Generic[Context]):
 				page_filter=page_filter,
 			)
 			self.registry.actions[func.__name__] = action
+			self._action_models.clear()
 			return func
 
 		return decorator
@@ -93,7 +96,7 @@ class Registry(Generic[Context]):
 	async def execute_action(
 		self,
 		action_name: str,
-		params: dict,
+		params: dict | BaseModel,
 		browser: Optional[BrowserContext] = None,
 		page_extraction_llm: Optional[BaseChatModel] = None,
 		sensitive_data: Optional[Dict[str, str]] = None,
@@ -101,14 +104,24 @@ class Registry(Generic[Context]):
 		#
 		context: Context | None = None,
 	) -> Any:
-		"""Execute a registered action"""
+		"""
+		Execute a registered action
+
+		params can be a raw dict, which is validated against the action's param model, or an instance of that
+		param model (e.g. taken from an already validated ActionModel), which is trusted as-is.
+		"""
 		if action_name not in self.registry.actions:
 			raise ValueError(f'Action {action_name} not found')
 
 		action = self.registry.actions[action_name]
 		try:
-			# Create the validated Pydantic model
-			validated_params = action.param_model(**params)
+			# Create the validated Pydantic model, unless params were already validated
+			if isinstance(params, action.param_model):
+				validated_params = params
+			else:
+				if isinstance(params, BaseModel):
+					params = params.model_dump()
+				validated_params = action.param_model(**params)
 
 			# Check if the first parameter is a Pydantic model
 			sig = signature(action.function)
@@ -201,6 +214,10 @@ class Registry(Generic[Context]):
 			if domain_is_allowed and page_is_allowed:
 				available_actions[name] = action
 
+		cache_key = tuple(available_actions)
+		if cache_key in self._action_models:
+			return self._action_models[cache_key]
+
 		fields = {
 			name: (
 				Optional[action.param_model],
@@ -218,7 +235,9 @@ class Registry(Generic[Context]):
 			)
 		)
 
-		return create_model('ActionModel', __base__=ActionModel, **fields)  # type:ignore
+		action_model = create_model('ActionModel', __base__=ActionModel, **fields)  # type:ignore
+		self._action_models[cache_key] = action_model
+		return action_model
 
 	def get_prompt_description(self, page=None) -> str:
 		"""Get a description of all actions for the prompt
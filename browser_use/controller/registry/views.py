@@ -60,9 +60,9 @@ class ActionModel(BaseModel):
 		action_name = next(iter(action_data.keys()))
 		action_params = getattr(self, action_name)
 
-		# Update the index directly on the model
+		# Action params are frozen, so swap in an updated copy
 		if hasattr(action_params, 'index'):
-			action_params.index = index
+			setattr(self, action_name, action_params.model_copy(update={'index': index}))
 
 
 class ActionRegistry(BaseModel):
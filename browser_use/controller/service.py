@@ -84,8 +84,8 @@ class Controller(Generic[Context]):
 		)
 		async def search_google(params: SearchGoogleAction, browser: BrowserContext):
 			page = await browser.get_current_page()
-			await page.goto(f'https://www.google.com/search?q={params.query}&udm=14')
-			await page.wait_for_load_state()
+			await page.goto(f'https://www.google.com/search?q={params.query}&udm=14', wait_until=browser.config.wait_until)
+			await page.wait_for_load_state(browser.config.wait_until)
 			msg = f'🔍  Searched for "{params.query}" in Google'
 			logger.info(msg)
 			return ActionResult(extracted_content=msg, include_in_memory=True)
@@ -93,8 +93,8 @@ class Controller(Generic[Context]):
 		@self.registry.action('Navigate to URL in the current tab', param_model=GoToUrlAction)
 		async def go_to_url(params: GoToUrlAction, browser: BrowserContext):
 			page = await browser.get_current_page()
-			await page.goto(params.url)
-			await page.wait_for_load_state()
+			await page.goto(params.url, wait_until=browser.config.wait_until)
+			await page.wait_for_load_state(browser.config.wait_until)
 			msg = f'🔗  Navigated to {params.url}'
 			logger.info(msg)
 			return ActionResult(extracted_content=msg, include_in_memory=True)
@@ -192,7 +192,7 @@ class Controller(Generic[Context]):
 			await browser.switch_to_tab(params.page_id)
 			# Wait for tab to be ready
 			page = await browser.get_current_page()
-			await page.wait_for_load_state()
+			await page.wait_for_load_state(browser.config.wait_until)
 			msg = f'🔄  Switched to tab {params.page_id}'
 			logger.info(msg)
 			return ActionResult(extracted_content=msg, include_in_memory=True)
@@ -754,7 +754,11 @@ class Controller(Generic[Context]):
 		"""Execute an action"""
 
 		try:
-			for action_name, params in action.model_dump(exclude_unset=True).items():
+			# pass the already validated param models through instead of dumping and re-validating them
+			for action_name in type(action).model_fields:
+				if action_name not in action.model_fields_set:
+					continue
+				params = getattr(action, action_name)
 				if params is not None:
 					# with Laminar.start_as_current_span(
 					# 	name=action_name,
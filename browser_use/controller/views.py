@@ -1,54 +1,80 @@
-from typing import Optional
+from typing import Any, Optional, Self
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
+def _drop_additional_properties(schema: dict[str, Any]) -> None:
+	# extra fields are rejected during validation, but some LLM APIs (e.g. Gemini) don't accept additionalProperties in tool schemas
+	schema.pop('additionalProperties', None)
+
+
+class BaseAction(BaseModel):
+	"""
+	Base class for action params: parsed once per LLM action and never mutated afterwards,
+	so instances are frozen and unknown fields are rejected instead of silently dropped.
+	"""
+
+	model_config = ConfigDict(
+		frozen=True, extra='forbid', validate_assignment=False, json_schema_extra=_drop_additional_properties
+	)
+
+	@classmethod
+	def make(cls, **kwargs: Any) -> Self:
+		"""
+		Build params without validation, for actions the code creates itself.
+
+		Only use this for trusted, well-typed values; anything coming from the LLM or the user must go
+		through normal construction / model_validate.
+		"""
+		return cls.model_construct(**kwargs)
+
+
 # Action Input Models
-class SearchGoogleAction(BaseModel):
+class SearchGoogleAction(BaseAction):
 	query: str
 
 
-class GoToUrlAction(BaseModel):
+class GoToUrlAction(BaseAction):
 	url: str
 
 
-class ClickElementAction(BaseModel):
+class ClickElementAction(BaseAction):
 	index: int
 	xpath: Optional[str] = None
 
 
-class InputTextAction(BaseModel):
+class InputTextAction(BaseAction):
 	index: int
 	text: str
 	xpath: Optional[str] = None
 
 
-class DoneAction(BaseModel):
+class DoneAction(BaseAction):
 	text: str
 	success: bool
 
 
-class SwitchTabAction(BaseModel):
+class SwitchTabAction(BaseAction):
 	page_id: int
 
 
-class OpenTabAction(BaseModel):
+class OpenTabAction(BaseAction):
 	url: str
 
 
-class CloseTabAction(BaseModel):
+class CloseTabAction(BaseAction):
 	page_id: int
 
 
-class ScrollAction(BaseModel):
+class ScrollAction(BaseAction):
 	amount: Optional[int] = None  # The number of pixels to scroll. If None, scroll down/up one page
 
 
-class SendKeysAction(BaseModel):
+class SendKeysAction(BaseAction):
 	keys: str
 
 
-class GroupTabsAction(BaseModel):
+class GroupTabsAction(BaseAction):
 	tab_ids: list[int] = Field(..., description='List of tab IDs to group')
 	title: str = Field(..., description='Name for the tab group')
 	color: Optional[str] = Field(
@@ -57,21 +83,21 @@ class GroupTabsAction(BaseModel):
 	)
 
 
-class UngroupTabsAction(BaseModel):
+class UngroupTabsAction(BaseAction):
 	tab_ids: list[int] = Field(..., description='List of tab IDs to ungroup')
 
 
-class ExtractPageContentAction(BaseModel):
+class ExtractPageContentAction(BaseAction):
 	value: str
 
 
-class NoParamsAction(BaseModel):
+class NoParamsAction(BaseAction):
 	"""
 	Accepts absolutely anything in the incoming data
 	and discards it, so the final parsed model is empty.
 	"""
 
-	model_config = ConfigDict(extra='allow')
+	model_config = ConfigDict(extra='allow', json_schema_extra=None)
 
 	@model_validator(mode='before')
 	def ignore_all_inputs(cls, values):
@@ -79,12 +105,12 @@ class NoParamsAction(BaseModel):
 		return {}
 
 
-class Position(BaseModel):
+class Position(BaseAction):
 	x: int
 	y: int
 
 
-class DragDropAction(BaseModel):
+class DragDropAction(BaseAction):
 	# Element-based approach
 	element_source: Optional[str] = Field(None, description='CSS selector or XPath of the element to drag from')
 	element_target: Optional[str] = Field(None, description='CSS selector or XPath of the element to drop onto')
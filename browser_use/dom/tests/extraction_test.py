@@ -1,8 +1,7 @@
 import asyncio
 import os
-
-import anyio
-from langchain_openai import ChatOpenAI
+from functools import lru_cache
+from pathlib import Path
 
 from browser_use.agent.prompts import AgentMessagePrompt
 from browser_use.browser.browser import Browser, BrowserConfig
@@ -10,6 +9,14 @@ from browser_use.browser.context import BrowserContext, BrowserContextConfig
 from browser_use.dom.service import DomService
 
 
+@lru_cache(maxsize=8)
+def _get_encoding(model: str):
+	"""Load the tiktoken encoding for a model once and reuse it across calls."""
+	import tiktoken
+
+	return tiktoken.encoding_for_model(model)
+
+
 def count_string_tokens(string: str, model: str) -> tuple[int, float]:
 	"""Count the number of tokens in a string using a specified model."""
 
@@ -24,8 +31,7 @@ def count_string_tokens(string: str, model: str) -> tuple[int, float]:
 		}
 		return prices[model]
 
-	llm = ChatOpenAI(model=model)
-	token_count = llm.get_num_tokens(string)
+	token_count = len(_get_encoding(model).encode(string))
 	price = token_count * get_price_per_token(model)
 	return token_count, price
 
@@ -45,6 +51,7 @@ DEFAULT_INCLUDE_ATTRIBUTES = [
 	'aria-expanded',
 	'data-date-format',
 ]
+DEFAULT_INCLUDE_ATTRIBUTES_SET = frozenset(DEFAULT_INCLUDE_ATTRIBUTES)
 
 
 async def test_focus_vs_all_elements():
@@ -79,14 +86,20 @@ async def test_focus_vs_all_elements():
 		'https://github.com',
 	]
 
+	os.makedirs('./tmp', exist_ok=True)
+	user_message_path = Path('./tmp/user_message.txt')
+
 	async with context as context:
 		page = await context.get_current_page()
 		dom_service = DomService(page)
 
 		for website in websites:
-			# sleep 2
-			await page.goto(website)
-			asyncio.sleep(1)
+			try:
+				await page.goto(website, timeout=TIMEOUT * 1000)
+				await page.wait_for_load_state('domcontentloaded', timeout=TIMEOUT * 1000)
+			except Exception as e:
+				print(f'Failed to load {website}: {e}')
+				continue
 
 			last_clicked_index = None  # Track the index for text input
 			while True:
@@ -105,15 +118,13 @@ async def test_focus_vs_all_elements():
 					prompt = AgentMessagePrompt(
 						state=all_elements_state,
 						result=None,
-						include_attributes=DEFAULT_INCLUDE_ATTRIBUTES,
+						include_attributes=DEFAULT_INCLUDE_ATTRIBUTES_SET,
 						step_info=None,
 					)
 					# print(prompt.get_user_message(use_vision=False).content)
 					# Write the user message to a file for analysis
 					user_message = prompt.get_user_message(use_vision=False).content
-					os.makedirs('./tmp', exist_ok=True)
-					async with await anyio.open_file('./tmp/user_message.txt', 'w', encoding='utf-8') as f:
-						await f.write(user_message)
+					await asyncio.to_thread(user_message_path.write_text, user_message, encoding='utf-8')
 
 					token_count, price = count_string_tokens(user_message, model='gpt-4o')
 					print(f'Prompt token count: {token_count}, price: {round(price, 4)} USD')
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from functools import cached_property
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Collection, Dict, List, Optional
 
 from browser_use.dom.history_tree_processor.view import CoordinateSet, HashedDomElement, ViewportInfo
 from browser_use.utils import time_execution_sync
@@ -9,6 +9,9 @@ from browser_use.utils import time_execution_sync
 if TYPE_CHECKING:
 	from .views import DOMElementNode
 
+# Attributes that matter for picking an action, see `clickable_elements_to_string(minimal_attrs=True)`
+MINIMAL_ATTRIBUTES = frozenset(('id', 'name', 'type', 'role', 'href', 'value', 'placeholder', 'aria-label', 'title', 'alt'))
+
 
 @dataclass(frozen=False)
 class DOMBaseNode:
@@ -129,7 +132,40 @@ class DOMElementNode(DOMBaseNode):
 
 		return HistoryTreeProcessor._hash_dom_element(self)
 
+	def _subtree_hashes(self) -> Dict[int, int]:
+		"""
+		Hash everything that `clickable_elements_to_string` renders for each element subtree, keyed by id(element).
+
+		Child hashes are folded in bottom-up, so a subtree keeps its hash between two page states as long as
+		nothing inside it changed. The hashes are recomputed on every call, so the tree may be changed in between.
+		"""
+		hashes: Dict[int, int] = {}
+
+		def hash_node(node: DOMElementNode) -> int:
+			children_hashes = tuple(
+				hash_node(child) if isinstance(child, DOMElementNode) else hash(getattr(child, 'text', None))
+				for child in node.children
+			)
+			node_hash = hash(
+				(
+					node.tag_name,
+					tuple(node.attributes.items()),
+					node.highlight_index,
+					node.is_new,
+					node.is_visible,
+					node.is_top_element,
+					children_hashes,
+				)
+			)
+			hashes[id(node)] = node_hash
+			return node_hash
+
+		hash_node(self)
+		return hashes
+
 	def get_all_text_till_next_clickable_element(self, max_depth: int = -1) -> str:
+		# not memoized: nodes are changed in place (e.g. highlight_index, is_new) and the walk stops at the next
+		# highlighted element, so rendering all highlighted elements visits each text node once
 		text_parts = []
 
 		def collect_text(node: DOMBaseNode, current_depth: int) -> None:
@@ -149,88 +185,151 @@ class DOMElementNode(DOMBaseNode):
 		collect_text(self, 0)
 		return '\n'.join(text_parts).strip()
 
+	def contains_text(self, needle: str) -> bool:
+		"""
+		Check if any text node in this subtree contains needle, stopping at the first match.
+
+		Unlike `get_all_text_till_next_clickable_element`, the search does not stop at clickable (highlighted) descendants,
+		text inside them is searched too. Each text node is checked on its own, so a needle split across two text nodes
+		is not found.
+		"""
+		stack: List[DOMBaseNode] = [self]
+		while stack:
+			node = stack.pop()
+			if isinstance(node, DOMTextNode):
+				if needle in node.text:
+					return True
+			elif isinstance(node, DOMElementNode):
+				stack.extend(reversed(node.children))
+		return False
+
 	@time_execution_sync('--clickable_elements_to_string')
-	def clickable_elements_to_string(self, include_attributes: list[str] | None = None) -> str:
-		"""Convert the processed DOM content to HTML."""
+	def clickable_elements_to_string(
+		self,
+		include_attributes: Collection[str] | None = None,
+		render_cache: Optional[Dict[tuple, tuple[str, ...]]] = None,
+		minimal_attrs: bool = False,
+	) -> str:
+		"""
+		Convert the processed DOM content to HTML.
+
+		render_cache: the lines rendered for each element subtree, keyed by a hash of its content. Pass the same dict on
+		every call for consecutive states of a page: subtrees that did not change since the previous call are copied
+		from it instead of being walked again, and afterwards it only holds the subtrees of this tree.
+
+		minimal_attrs: only keep the attributes in `MINIMAL_ATTRIBUTES` (id, name, type, role, href, value, placeholder,
+		aria-label, title, alt). If include_attributes is given as well, only the attributes in both are kept.
+		"""
 		formatted_text = []
-
-		def process_node(node: DOMBaseNode, depth: int) -> None:
-			next_depth = int(depth)
+		# membership is checked for every attribute of every highlighted node
+		include_attributes_set = frozenset(include_attributes) if include_attributes else frozenset()
+		if minimal_attrs:
+			include_attributes_set = include_attributes_set & MINIMAL_ATTRIBUTES if include_attributes else MINIMAL_ATTRIBUTES
+		rendered_subtrees: Dict[tuple, tuple[str, ...]] = {}
+		subtree_hashes = self._subtree_hashes() if render_cache is not None else {}
+
+		# Whether a node sits under a highlighted element is threaded down the walk instead of
+		# re-walking the parent chain for every text node
+		def process_node(node: DOMBaseNode, depth: int, has_highlighted_parent: bool) -> None:
 			depth_str = depth * '\t'
 
 			if isinstance(node, DOMElementNode):
-				# Add element with highlight_index
-				if node.highlight_index is not None:
-					next_depth += 1
-
-					text = node.get_all_text_till_next_clickable_element()
-					attributes_html_str = ''
-					if include_attributes:
-						attributes_to_include = {
-							key: str(value) for key, value in node.attributes.items() if key in include_attributes
-						}
-
-						# Easy LLM optimizations
-						# if tag == role attribute, don't include it
-						if node.tag_name == attributes_to_include.get('role'):
-							del attributes_to_include['role']
-
-						# if aria-label == text of the node, don't include it
-						if (
-							attributes_to_include.get('aria-label')
-							and attributes_to_include.get('aria-label', '').strip() == text.strip()
-						):
-							del attributes_to_include['aria-label']
-
-						# if placeholder == text of the node, don't include it
-						if (
-							attributes_to_include.get('placeholder')
-							and attributes_to_include.get('placeholder', '').strip() == text.strip()
-						):
-							del attributes_to_include['placeholder']
-
-						if attributes_to_include:
-							# Format as key1='value1' key2='value2'
-							attributes_html_str = ' '.join(f"{key}='{value}'" for key, value in attributes_to_include.items())
-
-					# Build the line
-					if node.is_new:
-						highlight_indicator = f'*[{node.highlight_index}]*'
+				if render_cache is not None:
+					key = (subtree_hashes[id(node)], depth, has_highlighted_parent, include_attributes_set)
+					lines = render_cache.get(key)
+					if lines is None:
+						start = len(formatted_text)
+						render_element(node, depth, has_highlighted_parent)
+						lines = tuple(formatted_text[start:])
 					else:
-						highlight_indicator = f'[{node.highlight_index}]'
-
-					line = f'{depth_str}{highlight_indicator}<{node.tag_name}'
-
-					if attributes_html_str:
-						line += f' {attributes_html_str}'
-
-					if text:
-						# Add space before >text only if there were NO attributes added before
-						if not attributes_html_str:
-							line += ' '
-						line += f'>{text}'
-					# Add space before /> only if neither attributes NOR text were added
-					elif not attributes_html_str:
-						line += ' '
-
-					line += ' />'  # 1 token
-					formatted_text.append(line)
-
-				# Process children regardless
-				for child in node.children:
-					process_node(child, next_depth)
+						formatted_text.extend(lines)
+					rendered_subtrees[key] = lines
+				else:
+					render_element(node, depth, has_highlighted_parent)
 
 			elif isinstance(node, DOMTextNode):
 				# Add text only if it doesn't have a highlighted parent
 				if (
-					not node.has_parent_with_highlight_index()
-					and node.parent
-					and node.parent.is_visible
-					and node.parent.is_top_element
+					not has_highlighted_parent and node.parent and node.parent.is_visible and node.parent.is_top_element
 				):  # and node.is_parent_top_element()
 					formatted_text.append(f'{depth_str}{node.text}')
 
-		process_node(self, 0)
+		def render_element(node: 'DOMElementNode', depth: int, has_highlighted_parent: bool) -> None:
+			next_depth = int(depth)
+			depth_str = depth * '\t'
+
+			# Add element with highlight_index
+			if node.highlight_index is not None:
+				next_depth += 1
+
+				text = node.get_all_text_till_next_clickable_element()
+				attributes_html_str = ''
+				if include_attributes_set:
+					attributes_to_include = {
+						key: str(value) for key, value in node.attributes.items() if key in include_attributes_set
+					}
+
+					# Easy LLM optimizations
+					# if tag == role attribute, don't include it
+					if node.tag_name == attributes_to_include.get('role'):
+						del attributes_to_include['role']
+
+					# if aria-label == text of the node, don't include it
+					if (
+						attributes_to_include.get('aria-label')
+						and attributes_to_include.get('aria-label', '').strip() == text.strip()
+					):
+						del attributes_to_include['aria-label']
+
+					# if placeholder == text of the node, don't include it
+					if (
+						attributes_to_include.get('placeholder')
+						and attributes_to_include.get('placeholder', '').strip() == text.strip()
+					):
+						del attributes_to_include['placeholder']
+
+					if attributes_to_include:
+						# Format as key1='value1' key2='value2'
+						attributes_html_str = ' '.join(f"{key}='{value}'" for key, value in attributes_to_include.items())
+
+				# Build the line
+				if node.is_new:
+					highlight_indicator = f'*[{node.highlight_index}]*'
+				else:
+					highlight_indicator = f'[{node.highlight_index}]'
+
+				line = f'{depth_str}{highlight_indicator}<{node.tag_name}'
+
+				if attributes_html_str:
+					line += f' {attributes_html_str}'
+
+				if text:
+					# Add space before >text only if there were NO attributes added before
+					if not attributes_html_str:
+						line += ' '
+					line += f'>{text}'
+				# Add space before /> only if neither attributes NOR text were added
+				elif not attributes_html_str:
+					line += ' '
+
+				line += ' />'  # 1 token
+				formatted_text.append(line)
+
+			# Process children regardless
+			children_have_highlighted_parent = has_highlighted_parent or node.highlight_index is not None
+			for child in node.children:
+				process_node(child, next_depth, children_have_highlighted_parent)
+
+		has_highlighted_parent = False
+		ancestor = self.parent
+		while ancestor is not None and not has_highlighted_parent:
+			has_highlighted_parent = ancestor.highlight_index is not None
+			ancestor = ancestor.parent
+
+		process_node(self, 0, has_highlighted_parent)
+		if render_cache is not None:
+			render_cache.clear()
+			render_cache.update(rendered_subtrees)
 		return '\n'.join(formatted_text)
 
 	def get_file_upload_element(self, check_siblings: bool = True) -> Optional['DOMElementNode']:
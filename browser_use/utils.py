@@ -3,7 +3,9 @@ import logging
 import os
 import platform
 import signal
+import threading
 import time
+import weakref
 from functools import wraps
 from sys import stderr
 from typing import Any, Callable, Coroutine, List, Optional, ParamSpec, TypeVar
@@ -26,11 +28,14 @@ class SignalHandler:
 	This class provides:
 	- Configurable signal handling for SIGINT and SIGTERM
 	- Support for custom pause/resume callbacks
-	- Management of event loop state across signals
+	- Management of Ctrl+C state across signals
 	- Standardized handling of first and second Ctrl+C presses
 	- Cross-platform compatibility (with simplified behavior on Windows)
 	"""
 
+	# Tasks that should be cancelled on the first Ctrl+C, see register_task()
+	interruptible_tasks: 'weakref.WeakSet[asyncio.Task]' = weakref.WeakSet()
+
 	def __init__(
 		self,
 		loop: Optional[asyncio.AbstractEventLoop] = None,
@@ -49,18 +54,20 @@ class SignalHandler:
 			resume_callback: Function to call when system is resumed
 			custom_exit_callback: Function to call on exit (second Ctrl+C or SIGTERM)
 			exit_on_second_int: Whether to exit on second SIGINT (Ctrl+C)
-			interruptible_task_patterns: List of patterns to match task names that should be
-										 canceled on first Ctrl+C (default: ['step', 'multi_act', 'get_next_action'])
+			interruptible_task_patterns: Fallback for tasks that are not registered via register_task():
+										 tasks whose names contain any of these patterns are also canceled on
+										 first Ctrl+C (e.g. ['step', 'multi_act', 'get_next_action']).
+										 Scanning all tasks by name is only done when patterns are given.
 		"""
 		self.loop = loop or asyncio.get_event_loop()
 		self.pause_callback = pause_callback
 		self.resume_callback = resume_callback
 		self.custom_exit_callback = custom_exit_callback
 		self.exit_on_second_int = exit_on_second_int
-		self.interruptible_task_patterns = interruptible_task_patterns or ['step', 'multi_act', 'get_next_action']
+		self.interruptible_task_patterns = interruptible_task_patterns or []
 		self.is_windows = platform.system() == 'Windows'
 
-		# Initialize loop state attributes
+		# Initialize signal state attributes
 		self._initialize_loop_state()
 
 		# Store original signal handlers to restore them later if needed
@@ -68,9 +75,9 @@ class SignalHandler:
 		self.original_sigterm_handler = None
 
 	def _initialize_loop_state(self) -> None:
-		"""Initialize loop state attributes used for signal handling."""
-		setattr(self.loop, 'ctrl_c_pressed', False)
-		setattr(self.loop, 'waiting_for_input', False)
+		"""Initialize state attributes used for signal handling."""
+		self.ctrl_c_pressed = False
+		self.waiting_for_input = False
 
 	def register(self) -> None:
 		"""Register signal handlers for SIGINT and SIGTERM."""
@@ -154,9 +161,9 @@ class SignalHandler:
 			# Already exiting, force exit immediately
 			os._exit(0)
 
-		if getattr(self.loop, 'ctrl_c_pressed', False):
+		if self.ctrl_c_pressed:
 			# If we're in the waiting for input state, let the pause method handle it
-			if getattr(self.loop, 'waiting_for_input', False):
+			if self.waiting_for_input:
 				return
 
 			# Second Ctrl+C - exit immediately if configured to do so
@@ -164,7 +171,7 @@ class SignalHandler:
 				self._handle_second_ctrl_c()
 
 		# Mark that Ctrl+C was pressed
-		self.loop.ctrl_c_pressed = True
+		self.ctrl_c_pressed = True
 
 		# Cancel current tasks that should be interruptible - this is crucial for immediate pausing
 		self._cancel_interruptible_tasks()
@@ -196,25 +203,36 @@ class SignalHandler:
 
 		os._exit(0)
 
+	@classmethod
+	def register_task(cls, task: asyncio.Task) -> asyncio.Task:
+		"""Mark a task as interruptible so it gets canceled on the first Ctrl+C. Returns the task for chaining."""
+		cls.interruptible_tasks.add(task)
+		return task
+
 	def _cancel_interruptible_tasks(self) -> None:
 		"""Cancel current tasks that should be interruptible."""
 		current_task = asyncio.current_task(self.loop)
-		for task in asyncio.all_tasks(self.loop):
-			if task != current_task and not task.done():
+
+		to_cancel = [task for task in list(self.interruptible_tasks) if task.get_loop() is self.loop]
+		if self.interruptible_task_patterns:
+			# fallback for code that names its tasks instead of registering them
+			for task in asyncio.all_tasks(self.loop):
 				task_name = task.get_name() if hasattr(task, 'get_name') else str(task)
-				# Cancel tasks that match certain patterns
 				if any(pattern in task_name for pattern in self.interruptible_task_patterns):
-					logger.debug(f'Cancelling task: {task_name}')
-					task.cancel()
-					# Add exception handler to silence "Task exception was never retrieved" warnings
-					task.add_done_callback(lambda t: t.exception() if t.cancelled() else None)
-
-		# Also cancel the current task if it's interruptible
-		if current_task and not current_task.done():
-			task_name = current_task.get_name() if hasattr(current_task, 'get_name') else str(current_task)
-			if any(pattern in task_name for pattern in self.interruptible_task_patterns):
-				logger.debug(f'Cancelling current task: {task_name}')
-				current_task.cancel()
+					to_cancel.append(task)
+
+		for task in set(to_cancel):
+			if task.done():
+				continue
+			if task is current_task:
+				# Also cancel the current task if it's interruptible
+				logger.debug(f'Cancelling current task: {task.get_name()}')
+				task.cancel()
+				continue
+			logger.debug(f'Cancelling task: {task.get_name()}')
+			task.cancel()
+			# Add exception handler to silence "Task exception was never retrieved" warnings
+			task.add_done_callback(lambda t: t.exception() if t.cancelled() else None)
 
 	def wait_for_resume(self) -> None:
 		"""
@@ -225,7 +243,7 @@ class SignalHandler:
 		a second Ctrl+C directly.
 		"""
 		# Set flag to indicate we're waiting for input
-		setattr(self.loop, 'waiting_for_input', True)
+		self.waiting_for_input = True
 
 		# Temporarily restore default signal handling for SIGINT
 		# This ensures KeyboardInterrupt will be raised during input()
@@ -262,27 +280,27 @@ class SignalHandler:
 			try:
 				# Restore our signal handler
 				signal.signal(signal.SIGINT, original_handler)
-				setattr(self.loop, 'waiting_for_input', False)
+				self.waiting_for_input = False
 			except Exception:
 				pass
 
 	def reset(self) -> None:
 		"""Reset state after resuming."""
 		# Clear the flags
-		if hasattr(self.loop, 'ctrl_c_pressed'):
-			self.loop.ctrl_c_pressed = False
-		if hasattr(self.loop, 'waiting_for_input'):
-			self.loop.waiting_for_input = False
+		self.ctrl_c_pressed = False
+		self.waiting_for_input = False
 
 
 def time_execution_sync(additional_text: str = '') -> Callable[[Callable[P, R]], Callable[P, R]]:
 	def decorator(func: Callable[P, R]) -> Callable[P, R]:
 		@wraps(func)
 		def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-			start_time = time.time()
+			if not logger.isEnabledFor(logging.DEBUG):
+				return func(*args, **kwargs)
+			start_time = time.perf_counter()
 			result = func(*args, **kwargs)
-			execution_time = time.time() - start_time
-			logger.debug(f'{additional_text} Execution time: {execution_time:.2f} seconds')
+			execution_time = time.perf_counter() - start_time
+			logger.debug('%s Execution time: %.2f seconds', additional_text, execution_time)
 			return result
 
 		return wrapper
@@ -296,10 +314,12 @@ def time_execution_async(
 	def decorator(func: Callable[P, Coroutine[Any, Any, R]]) -> Callable[P, Coroutine[Any, Any, R]]:
 		@wraps(func)
 		async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-			start_time = time.time()
+			if not logger.isEnabledFor(logging.DEBUG):
+				return await func(*args, **kwargs)
+			start_time = time.perf_counter()
 			result = await func(*args, **kwargs)
-			execution_time = time.time() - start_time
-			logger.debug(f'{additional_text} Execution time: {execution_time:.2f} seconds')
+			execution_time = time.perf_counter() - start_time
+			logger.debug('%s Execution time: %.2f seconds', additional_text, execution_time)
 			return result
 
 		return wrapper
@@ -308,16 +328,22 @@ def time_execution_async(
 
 
 def singleton(cls):
-	instance = [None]
+	instance = None
+	lock = threading.Lock()
 
 	def wrapper(*args, **kwargs):
-		if instance[0] is None:
-			instance[0] = cls(*args, **kwargs)
-		return instance[0]
+		nonlocal instance
+		if instance is None:
+			# double-checked so concurrent first calls from several threads still create a single instance
+			with lock:
+				if instance is None:
+					instance = cls(*args, **kwargs)
+		return instance
 
 	return wrapper
 
 
 def check_env_variables(keys: list[str], any_or_all=all) -> bool:
 	"""Check if all required environment variables are set"""
-	return any_or_all(os.getenv(key, '').strip() for key in keys)
+	# whitespace-only values count as unset, checked without allocating a stripped copy
+	return any_or_all(bool(value and not value.isspace()) for value in (os.getenv(key, '') for key in keys))
@@ -0,0 +1,32 @@
+"""
+Process-wide shared Browser for the examples.
+
+Examples call `await get_browser()` instead of creating their own Browser, so when several of them run in one
+process (batch/demo runs, notebooks) Chromium is launched once and reused by every Agent.
+Call `await close_browser()` once when done.
+"""
+
+import asyncio
+
+from browser_use import Browser, BrowserConfig
+
+_browser: Browser | None = None
+_lock = asyncio.Lock()
+
+
+async def get_browser(config: BrowserConfig | None = None) -> Browser:
+	"""Return the shared browser, creating it on first use. config only applies to that first call."""
+	global _browser
+	async with _lock:
+		if _browser is None:
+			_browser = Browser(config=config)
+		return _browser
+
+
+async def close_browser() -> None:
+	"""Close the shared browser, if it was created."""
+	global _browser
+	async with _lock:
+		if _browser is not None:
+			await _browser.close()
+			_browser = None
@@ -11,15 +11,14 @@ from browser_use import Agent, Browser, BrowserConfig
 
 dotenv.load_dotenv()
 
-browser = Browser(
-	config=BrowserConfig(
-		# NOTE: you need to close your chrome browser - so that this can open your browser in debug mode
-		browser_binary_path='/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
-	)
-)
-
 
 async def main():
+	browser = Browser(
+		config=BrowserConfig(
+			# NOTE: you need to close your chrome browser - so that this can open your browser in debug mode
+			browser_binary_path='/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+		)
+	)
 	agent = Agent(
 		task='In docs.google.com write my Papa a quick letter',
 		llm=ChatGoogleGenerativeAI(
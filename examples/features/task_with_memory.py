@@ -1,17 +1,17 @@
 import asyncio
 import json
+from pathlib import Path
 from typing import List
 
-import anyio
+import httpx
 from dotenv import load_dotenv
+from markdownify import markdownify
 
 load_dotenv()
 
 from langchain_openai import ChatOpenAI
 from pydantic import BaseModel
 
-from browser_use import Agent, Browser, BrowserConfig, Controller
-
 links = [
 	'https://docs.mem0.ai/components/llms/models/litellm',
 	'https://docs.mem0.ai/components/llms/models/mistral_AI',
@@ -51,48 +51,66 @@ class Links(BaseModel):
 	links: List[Link]
 
 
-initial_actions = [
-	{'open_tab': {'url': 'https://docs.mem0.ai/'}},
-]
-controller = Controller(output_model=Links)
-task_description = f"""
-Visit all the links provided in {links} and summarize the content of the page with url and title. There are {len(links)} links to visit. Make sure to visit all the links. Return a json with the following format: [{{url: <url>, title: <title>, summary: <summary>}}].
-
-Guidelines:
-1. Strictly stay on the domain https://docs.mem0.ai
-2. Do not visit any other websites.
-3. Ignore the links that are hashed (#) or javascript (:), or mailto, or tel, or other protocols
-4. Don't visit any other url other than the ones provided above.
-5. Capture the unique urls which are not already visited.
-6. If you visit any page that doesn't have host name docs.mem0.ai, then do not visit it and come back to the page with host name docs.mem0.ai.
+# The task is "fetch each page and summarize it", so the pages are fetched directly over HTTP and
+# summarized in a few batched LLM calls instead of navigating to every page with a browser agent.
+MAX_CONCURRENT_FETCHES = 10
+PAGES_PER_LLM_CALL = 5
+MAX_PAGE_CHARS = 8000
+
+SUMMARIZE_PROMPT = """
+Summarize each of the following {n} pages from https://docs.mem0.ai. For every page return its url, its title and a short summary of its content.
+Return exactly one entry per page, in the same order, and use the urls exactly as given.
+
+{pages}
 """
 
 
-async def main(max_steps=500):
-	config = BrowserConfig(headless=True)
-	browser = Browser(config=config)
+async def fetch_all(urls: List[str]) -> List[str]:
+	"""Fetch all urls concurrently and return their content as markdown (empty string if a fetch failed)."""
+	semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+	async with httpx.AsyncClient(follow_redirects=True, timeout=30) as client:
+
+		async def fetch(url: str) -> str:
+			async with semaphore:
+				try:
+					response = await client.get(url)
+					response.raise_for_status()
+				except httpx.HTTPError as e:
+					print(f'Failed to fetch {url}: {e}')
+					return ''
+			return markdownify(response.text, strip=['a', 'img', 'script', 'style'])[:MAX_PAGE_CHARS]
+
+		return await asyncio.gather(*(fetch(url) for url in urls))
 
-	agent = Agent(
-		task=task_description,
-		llm=ChatOpenAI(model='gpt-4o-mini'),
-		controller=controller,
-		initial_actions=initial_actions,
-		enable_memory=True,
-		browser=browser,
+
+async def summarize_pages(llm: ChatOpenAI, urls: List[str], pages: List[str]) -> List[Link]:
+	pages_text = '\n\n'.join(f'--- Page {i + 1}: {url} ---\n{page}' for i, (url, page) in enumerate(zip(urls, pages)))
+	# strict json_schema mode makes the response always parse into Links, no repair/retry pass needed
+	structured_llm = llm.with_structured_output(Links, method='json_schema', strict=True)
+	result = await structured_llm.ainvoke(SUMMARIZE_PROMPT.format(n=len(urls), pages=pages_text))
+	return result.links
+
+
+async def main():
+	llm = ChatOpenAI(model='gpt-4o-mini', temperature=0)
+
+	pages = await fetch_all(links)
+	fetched = [(url, page) for url, page in zip(links, pages) if page]
+
+	# a few pages per call keeps each prompt well within the context window
+	chunks = [fetched[i : i + PAGES_PER_LLM_CALL] for i in range(0, len(fetched), PAGES_PER_LLM_CALL)]
+	chunk_results = await asyncio.gather(
+		*(summarize_pages(llm, [url for url, _ in chunk], [page for _, page in chunk]) for chunk in chunks)
 	)
-	history = await agent.run(max_steps=max_steps)
-	result = history.final_result()
-	parsed_result = []
-	if result:
-		parsed: Links = Links.model_validate_json(result)
-		print(f'Total parsed links: {len(parsed.links)}')
-		for link in parsed.links:
-			parsed_result.append({'title': link.title, 'url': link.url, 'summary': link.summary})
-	else:
-		print('No result')
-
-	async with await anyio.open_file('result.json', 'w+') as f:
-		await f.write(json.dumps(parsed_result, indent=4))
+
+	parsed_result = [
+		{'title': link.title, 'url': link.url, 'summary': link.summary} for chunk_links in chunk_results for link in chunk_links
+	]
+	print(f'Total parsed links: {len(parsed_result)}')
+
+	# a single small write at the end of the run, cheaper synchronously than through an async file wrapper
+	Path('result.json').write_text(json.dumps(parsed_result, indent=4))  # noqa: ASYNC240
 
 
 if __name__ == '__main__':
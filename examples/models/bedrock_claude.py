@@ -6,15 +6,11 @@ Automated news analysis and sentiment scoring using Bedrock.
 
 import argparse
 import asyncio
-import os
-import sys
 
 import boto3
 from botocore.config import Config
 from langchain_aws import ChatBedrockConverse
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from browser_use import Agent
 from browser_use.browser.browser import Browser, BrowserConfig
 from browser_use.controller.service import Controller
@@ -40,30 +36,28 @@ task = (
 	'and provide a confidence score for the sentiment. Present the result in a tabular format.'
 )
 
-parser = argparse.ArgumentParser()
-parser.add_argument('--query', type=str, help='The query for the agent to execute', default=task)
-args = parser.parse_args()
-
-llm = get_llm()
-
-browser = Browser(
-	config=BrowserConfig(
-		# browser_binary_path='/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+async def main():
+	parser = argparse.ArgumentParser()
+	parser.add_argument('--query', type=str, help='The query for the agent to execute', default=task)
+	args = parser.parse_args()
+
+	browser = Browser(
+		config=BrowserConfig(
+			# browser_binary_path='/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+		)
 	)
-)
-
-agent = Agent(
-	task=args.query,
-	llm=llm,
-	controller=Controller(),
-	browser=browser,
-	validate_output=True,
-)
 
+	agent = Agent(
+		task=args.query,
+		llm=get_llm(),
+		controller=Controller(),
+		browser=browser,
+		validate_output=True,
+	)
 
-async def main():
 	await agent.run(max_steps=30)
 	await browser.close()
 
 
-asyncio.run(main())
+if __name__ == '__main__':
+	asyncio.run(main())
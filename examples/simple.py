@@ -1,10 +1,7 @@
-import os
-import sys
-
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 import asyncio
+import os
 
+from _shared_browser import close_browser, get_browser
 from dotenv import load_dotenv
 from langchain_google_genai import ChatGoogleGenerativeAI
 
@@ -24,8 +21,11 @@ task = 'go to devmatesolutions.com.'
 
 
 async def main():
-	agent = Agent(task=task, llm=llm)
-	await agent.run()
+	agent = Agent(task=task, llm=llm, browser=await get_browser())
+	try:
+		await agent.run()
+	finally:
+		await close_browser()
 
 
 if __name__ == '__main__':
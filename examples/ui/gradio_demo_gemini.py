@@ -1,12 +1,12 @@
-import asyncio
-import os
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Optional
 
 # Third-party imports
 import gradio as gr
 from dotenv import load_dotenv
 from langchain_openai import ChatOpenAI
+from pydantic import SecretStr
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
@@ -50,6 +50,12 @@ def parse_agent_history(history_str: str) -> None:
 			console.print()
 
 
+@lru_cache(maxsize=8)
+def get_llm(api_key: str, model: str) -> ChatOpenAI:
+	# one client per (key, model) so requests reuse its pooled keep-alive connections instead of a new TLS handshake per click
+	return ChatOpenAI(model=model, api_key=SecretStr(api_key))
+
+
 async def run_browser_task(
 	task: str,
 	api_key: str,
@@ -59,12 +65,10 @@ async def run_browser_task(
 	if not api_key.strip():
 		return 'Please provide an API key'
 
-	os.environ['OPENAI_API_KEY'] = api_key
-
 	try:
 		agent = Agent(
 			task=task,
-			llm=ChatOpenAI(model='gpt-4o'),
+			llm=get_llm(api_key, model),
 		)
 		result = await agent.run()
 		#  TODO: The result cloud be parsed better
@@ -85,15 +89,16 @@ def create_ui():
 					placeholder='E.g., Find flights from New York to London for next week',
 					lines=3,
 				)
-				model = gr.Dropdown(choices=['gpt-4', 'gpt-3.5-turbo'], label='Model', value='gpt-4')
+				model = gr.Dropdown(choices=['gpt-4o', 'gpt-4o-mini'], label='Model', value='gpt-4o')
 				headless = gr.Checkbox(label='Run Headless', value=True)
 				submit_btn = gr.Button('Run Task')
 
 			with gr.Column():
 				output = gr.Textbox(label='Output', lines=10, interactive=False)
 
+		# gradio runs coroutine handlers on its own event loop, so concurrent users share it
 		submit_btn.click(
-			fn=lambda *args: asyncio.run(run_browser_task(*args)),
+			fn=run_browser_task,
 			inputs=[task, api_key, model, headless],
 			outputs=output,
 		)
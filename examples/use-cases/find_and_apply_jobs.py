@@ -1,20 +1,38 @@
+import asyncio
+import hashlib
 import os
+from pathlib import Path
+
 from dotenv import load_dotenv
 import google.generativeai as genai
 
 # Load environment variables
 load_dotenv()
 
+MODEL_NAME = 'gemini-2.0-flash'
+# Answers are cached per prompt, so re-running the script doesn't call the API again
+CACHE_DIR = Path.home() / '.cache' / 'find_jobs'
+
 def setup_gemini():
     api_key = os.getenv("GEMINI_API_KEY")
     if not api_key:
         raise ValueError("Please set GEMINI_API_KEY in your .env file")
     genai.configure(api_key=api_key)
 
-def find_jobs():
-    # Initialize the model
-    model = genai.GenerativeModel('gemini-pro')
-    
+async def generate(task: str) -> str:
+    cache_file = CACHE_DIR / f"{hashlib.sha256(f'{MODEL_NAME}:{task}'.encode()).hexdigest()}.txt"
+    if cache_file.exists():
+        return cache_file.read_text(encoding='utf-8')
+
+    model = genai.GenerativeModel(MODEL_NAME)
+    response = await model.generate_content_async(task)
+    text = response.text
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    cache_file.write_text(text, encoding='utf-8')
+    return text
+
+async def find_jobs() -> str:
     # Example job search task
     task = """
     Help me find software engineering jobs:
@@ -24,18 +42,14 @@ def find_jobs():
     4. Provide application tips
     5. Suggest ways to make applications stand out
     """
-    
+
     try:
-        response = model.generate_content(task)
-        print("\nJob Search Results:")
-        print("==================")
-        print(response.text)
+        text = await generate(task)
+        return "\nJob Search Results:\n==================\n" + text
     except Exception as e:
-        print(f"Error during job search: {str(e)}")
+        return f"Error during job search: {str(e)}"
 
-def get_application_tips():
-    model = genai.GenerativeModel('gemini-pro')
-    
+async def get_application_tips() -> str:
     task = """
     Provide detailed tips for job applications:
     1. Resume optimization
@@ -44,26 +58,25 @@ def get_application_tips():
     4. Follow-up strategies
     5. Common mistakes to avoid
     """
-    
+
     try:
-        response = model.generate_content(task)
-        print("\nApplication Tips:")
-        print("================")
-        print(response.text)
+        text = await generate(task)
+        return "\nApplication Tips:\n================\n" + text
     except Exception as e:
-        print(f"Error getting application tips: {str(e)}")
+        return f"Error getting application tips: {str(e)}"
 
-def main():
+async def main():
     print("Job Search and Application Assistant")
     print("===================================")
-    
+
     try:
         setup_gemini()
-        find_jobs()
-        get_application_tips()
+        # the two prompts are independent, so they run concurrently and are printed in order once done
+        for section in await asyncio.gather(find_jobs(), get_application_tips()):
+            print(section)
     except Exception as e:
         print(f"Error: {str(e)}")
         print("Please make sure you have set your GEMINI_API_KEY in the .env file")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    asyncio.run(main())
@@ -7,22 +7,26 @@ Also you have to install PyPDF2 to read pdf files: pip install PyPDF2
 
 import asyncio
 import csv
+import io
 import logging
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+# only needed to import the shared examples/_shared_browser.py helper, browser_use itself is installed
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from _shared_browser import close_browser, get_browser
 from dotenv import load_dotenv
 from langchain_google_genai import ChatGoogleGenerativeAI
-from pydantic import BaseModel, SecretStr
+from pydantic import BaseModel
 from PyPDF2 import PdfReader
 
 from browser_use import ActionResult, Agent, Controller
-from browser_use.browser.browser import Browser, BrowserConfig
-from browser_use.browser.context import BrowserContext
+from browser_use.browser.browser import BrowserConfig
+from browser_use.browser.context import BrowserContext, BrowserContextConfig
 
 # Validate required environment variables
 load_dotenv()
@@ -49,12 +53,44 @@ class Job(BaseModel):
 	salary: Optional[str] = None
 
 
-@controller.action('Save jobs to file - with a score how well it fits to my profile', param_model=Job)
-def save_jobs(job: Job):
-	with open('jobs.csv', 'a', newline='') as f:
-		writer = csv.writer(f)
-		writer.writerow([job.title, job.company, job.link, job.salary, job.location])
+# Jobs are queued by save_jobs and written in batches by a single writer task started in main()
+_job_queue: asyncio.Queue[Job | None] = asyncio.Queue()
+JOB_BATCH_SIZE = 64
+JOB_BATCH_TIMEOUT = 0.05
+
+
+def _write_rows(f: io.TextIOWrapper, rows: list[list[str | None]]) -> None:
+	csv.writer(f).writerows(rows)
+	f.flush()
 
+
+async def _write_jobs(queue: asyncio.Queue[Job | None]) -> None:
+	"""Append queued jobs to jobs.csv, up to JOB_BATCH_SIZE rows per write, until a None sentinel is received."""
+	# the file I/O runs in a thread so writes don't block the agents on the event loop
+	f = await asyncio.to_thread(open, 'jobs.csv', 'a', newline='', buffering=1 << 16)
+	try:
+		done = False
+		while not done:
+			job = await queue.get()
+			batch = []
+			while job is not None:
+				batch.append([job.title, job.company, job.link, job.salary, job.location])
+				if len(batch) >= JOB_BATCH_SIZE:
+					break
+				try:
+					job = await asyncio.wait_for(queue.get(), timeout=JOB_BATCH_TIMEOUT)
+				except asyncio.TimeoutError:
+					break
+			done = job is None
+			if batch:
+				await asyncio.to_thread(_write_rows, f, batch)
+	finally:
+		await asyncio.to_thread(f.close)
+
+
+@controller.action('Save jobs to file - with a score how well it fits to my profile', param_model=Job)
+async def save_jobs(job: Job):
+	await _job_queue.put(job)
 	return 'Saved job to file'
 
 
@@ -64,12 +100,18 @@ def read_jobs():
 		return f.read()
 
 
+@lru_cache(maxsize=1)
+def _extract_cv_text(mtime_ns: int, size: int) -> str:
+	"""Parse the cv once per file version, keyed by its modification time and size."""
+	# read the file in one go and parse from memory; pages without a content stream are blank, skip them
+	pdf = PdfReader(io.BytesIO(CV.read_bytes()))
+	return ''.join(page.extract_text() or '' for page in pdf.pages if '/Contents' in page)
+
+
 @controller.action('Read my cv for context to fill forms')
 def read_cv():
-	pdf = PdfReader(CV)
-	text = ''
-	for page in pdf.pages:
-		text += page.extract_text() or ''
+	stat = CV.stat()
+	text = _extract_cv_text(stat.st_mtime_ns, stat.st_size)
 	logger.info(f'Read cv with {len(text)} characters')
 	return ActionResult(extracted_content=text, include_in_memory=True)
 
@@ -106,22 +148,14 @@ async def upload_cv(index: int, browser: BrowserContext):
 		return ActionResult(error=f'Failed to upload file to index {index}')
 
 
-browser = Browser(
-	config=BrowserConfig(
-		browser_binary_path=None,  # Let Playwright use its bundled browser
-		disable_security=False,    # Disable security features that might interfere
-	)
-)
-
-
 async def main():
 	ground_task = (
 		'You are a professional job finder. '
 		'1. Read my cv with read_cv'
 		'find web developer jobs and save them to a file'
-		'search jobs at linked in'
+		'search jobs at the job board given at the end of this task'
 		"If it asks you to verify as a human, click on the checkbox and then click on the button that says 'Continue'"
-		"Sign in as email and My Email for linked in is: //"
+		"If you are on linked in, sign in as email and My Email for linked in is: //"
 		"my password for linked in is: //"
 		"Search for web developer jobs"
 		"Job Location should be United States"
@@ -131,22 +165,42 @@ async def main():
 		"After clicking Easy Apply mentioned in the job. Slelect first cv option and fill all the options and click on submit application"
 		"Than close any pop up and continue with next job"
 	)
-	tasks = [
-		ground_task + '\n' + 'Google',
-	]
-	
+	# one agent per job board, each in its own browser context of the shared browser, searching concurrently
+	job_boards = ['LinkedIn', 'Indeed', 'Wellfound']
+	tasks = [ground_task + '\n' + board for board in job_boards]
+
 	model = ChatGoogleGenerativeAI(
 		model="gemini-2.0-flash",
 		google_api_key=os.getenv("GEMINI_API_KEY"),
 		temperature=0.0,
 	)
 
+	browser = await get_browser(
+		BrowserConfig(
+			browser_binary_path=None,  # Let Playwright use its bundled browser
+			disable_security=False,    # Disable security features that might interfere
+			# job search only needs the page text, skip images, fonts, media and stylesheets
+			new_context_config=BrowserContextConfig(block_resources=True),
+		)
+	)
+
+	contexts = [await browser.new_context(browser.config.new_context_config) for _ in tasks]
 	agents = []
-	for task in tasks:
-		agent = Agent(task=task, llm=model, controller=controller, browser=browser)
+	for task, context in zip(tasks, contexts):
+		agent = Agent(task=task, llm=model, controller=controller, browser=browser, browser_context=context)
 		agents.append(agent)
 
-	await asyncio.gather(*[agent.run() for agent in agents])
+	# save_jobs only enqueues, the single writer task serializes the CSV appends of all agents
+	writer_task = asyncio.create_task(_write_jobs(_job_queue))
+	try:
+		await asyncio.gather(*[agent.run() for agent in agents])
+	finally:
+		# flush the remaining jobs and close the file
+		await _job_queue.put(None)
+		await writer_task
+		for context in contexts:
+			await context.close()
+		await close_browser()
 
 
 if __name__ == '__main__':
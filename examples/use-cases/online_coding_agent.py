@@ -2,9 +2,6 @@
 
 import asyncio
 import os
-import sys
-
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from dotenv import load_dotenv
 from langchain_google_genai import ChatGoogleGenerativeAI
@@ -16,16 +13,18 @@ load_dotenv()
 if not os.getenv('GEMINI_API_KEY'):
 	raise ValueError('GEMINI_API_KEY is not set. Please add it to your environment variables.')
 
+# gemini-2.0-flash supports system instructions natively, so the system prompt is not folded into the user turns.
+# One client is shared by all three agents.
+model = ChatGoogleGenerativeAI(
+	model="gemini-2.0-flash",
+	google_api_key=os.getenv('GEMINI_API_KEY'),
+	temperature=0.0,
+)
+
 
 async def main():
 	browser = Browser()
 	async with await browser.new_context() as context:
-		model = ChatGoogleGenerativeAI(
-			model="gemini-2.0-flash",
-			google_api_key=os.getenv('GEMINI_API_KEY'),
-			convert_system_message_to_human=True
-		)
-
 		# Initialize browser agent
 		agent1 = Agent(
 			task='Open an online code editor programiz.',
@@ -43,9 +42,10 @@ async def main():
 			llm=model,
 			browser_context=context,
 		)
+		# the agents share one page, so they run in dependency order: open editor -> write code -> execute it
 		await agent1.run()
-		await executor.run()
 		await coder.run()
+		await executor.run()
 
 
 if __name__ == '__main__':
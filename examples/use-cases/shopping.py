@@ -1,47 +1,82 @@
-from dotenv import load_dotenv
-from langchain_google_genai import ChatGoogleGenerativeAI
-from browser_use import Agent, Browser
+import argparse
 import asyncio
 import os
+import signal
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+# only needed to import the shared examples/_shared_browser.py helper, browser_use itself is installed
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from _shared_browser import close_browser, get_browser
+from dotenv import load_dotenv
+from langchain_google_genai import ChatGoogleGenerativeAI
+
+from browser_use import Agent
 
 load_dotenv()
 
-task = """
-Visit [Noon.com](https://www.noon.com) and shop for women's clothing items with a total budget of 200 AED.
-
-Shopping List:
-- 1 Basic t-shirt (size M)
-- 1 Casual top (size M)
-- 1 Pair of basic pants (size M)
-
-Instructions:
-1. Navigate to noon.com
-2. Search for each item
-3. Make sure the total cost stays under 200 AED
-4. Add items to cart
-5. Proceed to checkout
-6. Output a summary of:
-   - Items purchased
-   - Total cost in AED
-"""
-
-browser = Browser()
-
-model = ChatGoogleGenerativeAI(
-	model="gemini-2.0-flash",
-	google_api_key=os.getenv("GEMINI_API_KEY"),
-	temperature=0.0,
-)
+PROMPTS_DIR = Path(__file__).parent / 'prompts'
+SHOPPING_PROMPTS = {
+	'noon': 'noon_shopping.md',  # women's clothing on noon.com
+	'migros': 'migros_shopping.md',  # grocery order on migros.ch
+}
+
+
+@lru_cache
+def load_prompt(name: str) -> str:
+	return (PROMPTS_DIR / SHOPPING_PROMPTS[name]).read_text(encoding='utf-8')
+
+
+async def wait_for_shutdown(timeout: float) -> None:
+	"""Wait until Ctrl+C is pressed or the timeout expires, whichever comes first."""
+	shutdown = asyncio.Event()
+	loop = asyncio.get_running_loop()
+	try:
+		loop.add_signal_handler(signal.SIGINT, shutdown.set)
+	except NotImplementedError:
+		# no loop signal handlers on Windows, Ctrl+C raises KeyboardInterrupt instead
+		pass
+	print(f'Keeping the browser open for {timeout:g}s, press Ctrl+C to close it now...')
+	try:
+		await asyncio.wait_for(shutdown.wait(), timeout=timeout)
+	except asyncio.TimeoutError:
+		pass
+	finally:
+		try:
+			loop.remove_signal_handler(signal.SIGINT)
+		except NotImplementedError:
+			pass
+
 
 async def main():
+	parser = argparse.ArgumentParser()
+	parser.add_argument('--shop', choices=sorted(SHOPPING_PROMPTS), default='noon', help='Which shopping task to run')
+	parser.add_argument(
+		'--keep-open-seconds',
+		type=float,
+		default=0,
+		help='Keep the browser open this long after the agent finishes (Ctrl+C closes it earlier)',
+	)
+	args = parser.parse_args()
+
+	model = ChatGoogleGenerativeAI(
+		model="gemini-2.0-flash",
+		google_api_key=os.getenv("GEMINI_API_KEY"),
+		temperature=0.0,
+	)
 	agent = Agent(
-		task=task,
+		task=load_prompt(args.shop),
 		llm=model,
-		browser=browser,
+		browser=await get_browser(),
 	)
-	await agent.run()
-	input('Press Enter to close the browser...')
-	await browser.close()
+	try:
+		await agent.run()
+		if args.keep_open_seconds > 0:
+			await wait_for_shutdown(args.keep_open_seconds)
+	finally:
+		await close_browser()
 
 if __name__ == '__main__':
 	asyncio.run(main())
@@ -1,11 +1,10 @@
 # Goal: A general-purpose web navigation agent for tasks like flight booking and course searching.
 
 import asyncio
+import json
 import os
-import sys
-
-# Adjust Python path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import time
+from pathlib import Path
 
 from dotenv import load_dotenv
 import google.generativeai as genai
@@ -26,7 +25,6 @@ if not gemini_api_key:
 llm = ChatGoogleGenerativeAI(
 	model="gemini-2.0-flash",
 	google_api_key=gemini_api_key,
-	convert_system_message_to_human=True
 )
 
 browser = Browser(
@@ -54,6 +52,36 @@ Search for the best priced resort in Bali on booking.com with the following requ
 - use your creativity from searching to finding to reserving the best resort in Bali , but in the end best room should be reserved. In any complex situation you must use your ultimate intelligence to go through.
 """
 
+class StepHistoryWriter:
+	"""Append every finished step to a JSONL file so a crashed run keeps the steps it completed."""
+
+	def __init__(self, path: str, flush_every: int = 4, flush_interval: float = 0.5):
+		Path(path).parent.mkdir(parents=True, exist_ok=True)
+		self.file = open(path, 'a', encoding='utf-8', buffering=1 << 16)
+		self.flush_every = flush_every
+		self.flush_interval = flush_interval
+		self.pending = 0
+		self.last_flush = time.monotonic()
+		self.written = 0
+
+	async def on_step_end(self, agent: Agent) -> None:
+		# write the history items added since the last step (usually one)
+		history = agent.state.history.history
+		for item in history[self.written :]:
+			self.file.write(json.dumps(item.model_dump()) + '\n')
+			self.pending += 1
+		self.written = len(history)
+
+		# coalesce a few steps per flush instead of flushing after every record
+		if self.pending >= self.flush_every or time.monotonic() - self.last_flush >= self.flush_interval:
+			self.file.flush()
+			self.pending = 0
+			self.last_flush = time.monotonic()
+
+	def close(self) -> None:
+		self.file.close()
+
+
 async def main():
 	agent = Agent(
 		task=TASK,
@@ -62,7 +90,11 @@ async def main():
 		validate_output=True,
 		enable_memory=False,
 	)
-	history = await agent.run(max_steps=50)
+	step_writer = StepHistoryWriter('./tmp/history.jsonl')
+	try:
+		history = await agent.run(max_steps=50, on_step_end=step_writer.on_step_end)
+	finally:
+		step_writer.close()
 	history.save_to_file('./tmp/history.json')
 
 if __name__ == '__main__':
@@ -1,6 +1,6 @@
-import asyncio
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Optional
 
 import gradio as gr
@@ -40,21 +40,24 @@ def parse_agent_history(history_str: str) -> None:
             console.print(panel)
             console.print()
 
+@lru_cache(maxsize=8)
+def get_model(api_key: str, model_name: str) -> genai.GenerativeModel:
+    # one client per (key, model), so clicks reuse its connections instead of a new TLS handshake each time
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel(model_name)
+
 async def run_browser_task(
     task: str,
     api_key: str,
-    model: str = 'gemini-pro',
+    model_name: str = 'gemini-pro',
     headless: bool = True,
 ) -> str:
     if not api_key.strip():
         return 'Please provide a Gemini API key'
 
     try:
-        # Configure Gemini
-        genai.configure(api_key=api_key)
-        
-        # Initialize the selected model
-        model = genai.GenerativeModel(model)
+        # Get the configured model for this key
+        model = get_model(api_key, model_name)
         
         # Create a prompt that includes the task
         prompt = f"""Task: {task}
@@ -64,7 +67,7 @@ async def run_browser_task(
         """
         
         # Generate response
-        response = model.generate_content(prompt)
+        response = await model.generate_content_async(prompt)
         return response.text
         
     except Exception as e:
@@ -118,8 +121,9 @@ def create_ui():
         - The tool uses Gemini's advanced models for task analysis
         """)
 
+        # gradio runs coroutine handlers on its own event loop, so concurrent users interleave on it
         submit_btn.click(
-            fn=lambda *args: asyncio.run(run_browser_task(*args)),
+            fn=run_browser_task,
             inputs=[task, api_key, model, headless],
             outputs=output,
         )
@@ -303,3 +303,22 @@ class TestActionFilters:
 		assert 'domain_filter_action' in non_matching_page_model.model_fields
 		assert 'page_filter_action' not in non_matching_page_model.model_fields
 		assert 'both_filters_action' not in non_matching_page_model.model_fields
+
+	def test_action_model_reused_until_new_action_registered(self):
+		"""Test that the same action model is returned for the same actions and rebuilt after a new registration"""
+		registry = Registry()
+
+		@registry.action(description='First action')
+		def first_action():
+			pass
+
+		model = registry.create_action_model()
+		assert registry.create_action_model() is model
+
+		@registry.action(description='Second action')
+		def second_action():
+			pass
+
+		new_model = registry.create_action_model()
+		assert new_model is not model
+		assert 'second_action' in new_model.model_fields
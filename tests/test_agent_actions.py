@@ -1,38 +1,89 @@
 import asyncio
 import os
 
+import httpx
 import pytest
+from langchain_core.messages import HumanMessage
 from langchain_openai import AzureChatOpenAI
 from pydantic import BaseModel, SecretStr
 
+from browser_use.agent.prompts import SystemPrompt
 from browser_use.agent.service import Agent
 from browser_use.agent.views import AgentHistoryList
 from browser_use.browser.browser import Browser, BrowserConfig
+from browser_use.browser.context import BrowserContextConfig
 from browser_use.browser.views import BrowserState
+from browser_use.controller.service import Controller
 
+try:
+	# uvloop has cheaper I/O callbacks than the stock loop, which adds up over the many CDP messages per agent step
+	from uvloop import new_event_loop
+except ImportError:  # not available on Windows
+	from asyncio import new_event_loop
 
-@pytest.fixture
-def llm():
-	"""Initialize language model for testing"""
 
-	# return ChatAnthropic(model_name='claude-3-5-sonnet-20240620', timeout=25, stop=None)
-	return AzureChatOpenAI(
-		model='gpt-4o',
-		api_version='2024-10-21',
-		azure_endpoint=os.getenv('AZURE_OPENAI_ENDPOINT', ''),
-		api_key=SecretStr(os.getenv('AZURE_OPENAI_KEY', '')),
-	)
-	# return ChatOpenAI(model='gpt-4o-mini')
+AZURE_OPENAI_ENDPOINT = os.getenv('AZURE_OPENAI_ENDPOINT', '')
+AZURE_OPENAI_KEY = os.getenv('AZURE_OPENAI_KEY', '')
+# every agent starts with the same long system prompt, one cache key lets all tests hit the same prompt-cache prefix
+# with pytest-xdist each worker gets its own key (PYTEST_XDIST_WORKER is unset without it)
+PROMPT_CACHE_KEY = f'browser_use_agent_v1{os.getenv("PYTEST_XDIST_WORKER", "")}'
+
+
+def assert_any_contains(contents: list[str], needles: list[str]) -> None:
+	"""Assert every needle occurs in at least one of contents, searching the joined text instead of each content"""
+	# contents are joined with newlines, so needles must not contain one to avoid matches across two contents
+	text = '\n'.join(contents)
+	missing = [needle for needle in needles if needle not in text]
+	if missing:
+		pytest.fail(f'{contents} does not contain {", ".join(missing)}')
+
+
+@pytest.fixture(scope='session')
+async def llm(event_loop):
+	"""Initialize language model for testing, one client and connection pool for the whole run"""
+	if not AZURE_OPENAI_ENDPOINT or not AZURE_OPENAI_KEY:
+		pytest.fail('AZURE_OPENAI_ENDPOINT and AZURE_OPENAI_KEY must be set to run the agent tests')
+
+	async with httpx.AsyncClient(limits=httpx.Limits(max_keepalive_connections=20), timeout=60) as http_client:
+		# yield ChatAnthropic(model_name='claude-3-5-sonnet-20240620', timeout=25, stop=None)
+		yield AzureChatOpenAI(
+			model='gpt-4o',
+			api_version='2024-10-21',
+			azure_endpoint=AZURE_OPENAI_ENDPOINT,
+			api_key=SecretStr(AZURE_OPENAI_KEY),
+			http_async_client=http_client,
+			extra_body={'prompt_cache_key': PROMPT_CACHE_KEY},
+		)
+		# yield ChatOpenAI(model='gpt-4o-mini')
 
 
 @pytest.fixture(scope='session')
 def event_loop():
 	"""Create an instance of the default event loop for each test case."""
-	loop = asyncio.get_event_loop_policy().new_event_loop()
+	loop = new_event_loop()
 	yield loop
 	loop.close()
 
 
+@pytest.fixture(scope='session')
+def controller():
+	"""One controller for all agents, so the default actions are registered once per run"""
+	return Controller()
+
+
+@pytest.fixture(scope='session', autouse=True)
+async def warmup_llm(llm, controller, event_loop):
+	"""Send the agent system prompt once before the first test, so every agent call hits the warm prompt cache"""
+	system_message = SystemPrompt(action_description=controller.registry.get_prompt_description()).get_system_message()
+	try:
+		await llm.ainvoke([system_message, HumanMessage(content='ping')])
+	except Exception as e:
+		# only a latency optimization, the tests themselves report a broken endpoint
+		print(f'LLM warm-up failed: {e}')
+
+
+# The agent tests are independent, run them in parallel with pytest-xdist, one browser per worker:
+# pytest -n 3 tests/test_agent_actions.py
 @pytest.fixture(scope='session')
 async def browser(event_loop):
 	browser_instance = Browser(
@@ -44,8 +95,9 @@ async def browser(event_loop):
 	await browser_instance.close()
 
 
-@pytest.fixture
+@pytest.fixture(scope='function')
 async def context(browser):
+	"""Cheap per-test context on the single session-scoped browser, so Chromium is launched once per run"""
 	async with await browser.new_context() as context:
 		yield context
 		# Clean up automatically happens with __aexit__
@@ -54,12 +106,14 @@ async def context(browser):
 # pytest tests/test_agent_actions.py -v -k "test_ecommerce_interaction" --capture=no
 # @pytest.mark.asyncio
 @pytest.mark.skip(reason='Kinda expensive to run')
-async def test_ecommerce_interaction(llm, context):
+async def test_ecommerce_interaction(llm, context, controller):
 	"""Test complex ecommerce interaction sequence"""
 	agent = Agent(
 		task="Go to amazon.com, search for 'laptop', filter by 4+ stars, and find the price of the first result",
 		llm=llm,
 		browser_context=context,
+		controller=controller,
+		tool_calling_method='json_schema',
 		save_conversation_path='tmp/test_ecommerce_interaction/conversation',
 	)
 
@@ -68,7 +122,7 @@ async def test_ecommerce_interaction(llm, context):
 	# Verify sequence of actions
 	action_sequence = []
 	for action in history.model_actions():
-		action_name = list(action.keys())[0]
+		action_name = next(iter(action))
 		if action_name in ['go_to_url', 'open_tab']:
 			action_sequence.append('navigate')
 		elif action_name == 'input_text':
@@ -92,18 +146,20 @@ async def test_ecommerce_interaction(llm, context):
 
 
 # @pytest.mark.asyncio
-async def test_error_recovery(llm, context):
+async def test_error_recovery(llm, context, controller):
 	"""Test agent's ability to recover from errors"""
 	agent = Agent(
 		task='Navigate to nonexistent-site.com and then recover by going to google.com ',
 		llm=llm,
 		browser_context=context,
+		controller=controller,
+		tool_calling_method='json_schema',
 	)
 
 	history: AgentHistoryList = await agent.run(max_steps=10)
 
-	actions_names = history.action_names()
-	actions = history.model_actions()
+	actions = [action for action, _ in history.iter_actions_and_content() if action is not None]
+	actions_names = [next(iter(action)) for action in actions]
 	assert 'go_to_url' in actions_names or 'open_tab' in actions_names, f'{actions_names} does not contain go_to_url or open_tab'
 	for action in actions:
 		if 'go_to_url' in action:
@@ -113,45 +169,43 @@ async def test_error_recovery(llm, context):
 
 
 # @pytest.mark.asyncio
-async def test_find_contact_email(llm, context):
+async def test_find_contact_email(llm, context, controller):
 	"""Test agent's ability to find contact email on a website"""
 	agent = Agent(
 		task='Go to https://browser-use.com/ and find out the contact email',
 		llm=llm,
 		browser_context=context,
+		controller=controller,
+		tool_calling_method='json_schema',
 	)
 
-	history: AgentHistoryList = await agent.run(max_steps=10)
+	email = 'info@browser-use.com'
+	history: AgentHistoryList = await agent.run(
+		max_steps=10, until=lambda h: any(email in content for content in h.extracted_content())
+	)
 
 	# Verify the agent found the contact email
-	extracted_content = history.extracted_content()
-	email = 'info@browser-use.com'
-	for content in extracted_content:
-		if email in content:
-			break
-	else:
-		pytest.fail(f'{extracted_content} does not contain {email}')
+	assert_any_contains(history.extracted_content(), [email])
 
 
 # @pytest.mark.asyncio
-async def test_agent_finds_installation_command(llm, context):
+async def test_agent_finds_installation_command(llm, context, controller):
 	"""Test agent's ability to find the pip installation command for browser-use on the web"""
 	agent = Agent(
 		task='Find the pip installation command for the browser-use repo',
 		llm=llm,
 		browser_context=context,
+		controller=controller,
+		tool_calling_method='json_schema',
 	)
 
-	history: AgentHistoryList = await agent.run(max_steps=10)
+	install_command = 'pip install browser-use'
+	history: AgentHistoryList = await agent.run(
+		max_steps=10, until=lambda h: any(install_command in content for content in h.extracted_content())
+	)
 
 	# Verify the agent found the correct installation command
-	extracted_content = history.extracted_content()
-	install_command = 'pip install browser-use'
-	for content in extracted_content:
-		if install_command in content:
-			break
-	else:
-		pytest.fail(f'{extracted_content} does not contain {install_command}')
+	assert_any_contains(history.extracted_content(), [install_command])
 
 
 class CaptchaTest(BaseModel):
@@ -161,60 +215,60 @@ class CaptchaTest(BaseModel):
 	additional_text: str | None = None
 
 
-# run 3 test: python -m pytest tests/test_agent_actions.py -v -k "test_captcha_solver" --capture=no --log-cli-level=INFO
-# pytest tests/test_agent_actions.py -v -k "test_captcha_solver" --capture=no --log-cli-level=INFO
-@pytest.mark.asyncio
-@pytest.mark.parametrize(
-	'captcha',
-	[
-		CaptchaTest(
-			name='Text Captcha',
-			url='https://2captcha.com/demo/text',
-			success_text='Captcha is passed successfully!',
-		),
-		CaptchaTest(
-			name='Basic Captcha',
-			url='https://captcha.com/demos/features/captcha-demo.aspx',
-			success_text='Correct!',
-		),
-		CaptchaTest(
-			name='Rotate Captcha',
-			url='https://2captcha.com/demo/rotatecaptcha',
-			success_text='Captcha is passed successfully',
-			additional_text='Use multiple clicks at once. click done when image is exact correct position.',
-		),
-		CaptchaTest(
-			name='MT Captcha',
-			url='https://2captcha.com/demo/mtcaptcha',
-			success_text='Verified Successfully',
-			additional_text='Stop when you solved it successfully.',
-		),
-	],
-)
-async def test_captcha_solver(llm, context, captcha: CaptchaTest):
-	"""Test agent's ability to solve different types of captchas"""
-	agent = Agent(
-		task=f'Go to {captcha.url} and solve the captcha. {captcha.additional_text}',
-		llm=llm,
-		browser_context=context,
-	)
-	from browser_use.agent.views import AgentHistoryList
-
-	history: AgentHistoryList = await agent.run(max_steps=7)
-
-	state: BrowserState = await context.get_state()
-
-	all_text = state.element_tree.get_all_text_till_next_clickable_element()
+CAPTCHAS = [
+	CaptchaTest(
+		name='Text Captcha',
+		url='https://2captcha.com/demo/text',
+		success_text='Captcha is passed successfully!',
+	),
+	CaptchaTest(
+		name='Basic Captcha',
+		url='https://captcha.com/demos/features/captcha-demo.aspx',
+		success_text='Correct!',
+	),
+	CaptchaTest(
+		name='Rotate Captcha',
+		url='https://2captcha.com/demo/rotatecaptcha',
+		success_text='Captcha is passed successfully',
+		additional_text='Use multiple clicks at once. click done when image is exact correct position.',
+	),
+	CaptchaTest(
+		name='MT Captcha',
+		url='https://2captcha.com/demo/mtcaptcha',
+		success_text='Verified Successfully',
+		additional_text='Stop when you solved it successfully.',
+	),
+]
+
+# Max captchas solved at once, keeps the concurrent LLM calls under the Azure OpenAI rate limits
+CAPTCHA_CONCURRENCY = 4
 
-	if not all_text:
-		all_text = ''
 
-	if not isinstance(all_text, str):
-		all_text = str(all_text)
-
-	solved = captcha.success_text in all_text
-	assert solved, f'Failed to solve {captcha.name}'
+# pytest tests/test_agent_actions.py -v -k "test_captcha_solver" --capture=no --log-cli-level=INFO
+@pytest.mark.asyncio
+async def test_captcha_solver_all(llm, browser, controller):
+	"""Test agent's ability to solve different types of captchas, all captchas run concurrently in their own context"""
+	semaphore = asyncio.Semaphore(CAPTCHA_CONCURRENCY)
+
+	async def solve(captcha: CaptchaTest) -> str | None:
+		async with semaphore:
+			# the captcha demo pages keep loading widgets and trackers after the DOM is ready, don't wait for them between steps
+			async with await browser.new_context(BrowserContextConfig(wait_until='domcontentloaded')) as context:
+				agent = Agent(
+					task=f'Go to {captcha.url} and solve the captcha. {captcha.additional_text}',
+					llm=llm,
+					browser_context=context,
+					controller=controller,
+					tool_calling_method='json_schema',
+					screenshot_quality='low',
+				)
+				await agent.run(max_steps=7)
+
+				state: BrowserState = await context.get_state()
+
+		return None if state.element_tree.contains_text(captcha.success_text) else captcha.name
+
+	failed = [name for name in await asyncio.gather(*(solve(captcha) for captcha in CAPTCHAS)) if name is not None]
+	assert not failed, f'Failed to solve {", ".join(failed)}'
 
 	# python -m pytest tests/test_agent_actions.py -v --capture=no
-
-	# pytest tests/test_agent_actions.py -v -k "test_captcha_solver" --capture=no --log-cli-level=INFO
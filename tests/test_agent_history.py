@@ -0,0 +1,59 @@
+from typing import Optional
+
+from browser_use.agent.views import ActionResult, AgentBrain, AgentHistory, AgentHistoryList, AgentOutput
+from browser_use.browser.views import BrowserStateHistory, TabInfo
+from browser_use.controller.registry.views import ActionModel
+from browser_use.controller.views import ClickElementAction, DoneAction, ExtractPageContentAction
+
+
+class _ActionModel(ActionModel):
+	click_element: Optional[ClickElementAction] = None
+	extract_page_content: Optional[ExtractPageContentAction] = None
+	done: Optional[DoneAction] = None
+
+
+def _step(actions: list[ActionModel] | None, results: list[ActionResult]) -> AgentHistory:
+	model_output = None
+	if actions is not None:
+		model_output = AgentOutput(
+			current_state=AgentBrain(evaluation_previous_goal='', memory='', next_goal=''),
+			action=actions,
+		)
+	return AgentHistory(
+		model_output=model_output,
+		result=results,
+		state=BrowserStateHistory(
+			url='https://example.com',
+			title='Example',
+			tabs=[TabInfo(page_id=1, url='https://example.com', title='Example')],
+			interacted_element=[None] * len(actions or []),
+		),
+	)
+
+
+def test_iter_actions_and_content():
+	"""Test that iter_actions_and_content pairs each action with the content of its result in a single pass"""
+	click = _ActionModel(click_element=ClickElementAction(index=1))
+	extract = _ActionModel(extract_page_content=ExtractPageContentAction(value='text'))
+	done = _ActionModel(done=DoneAction(text='Task completed', success=True))
+	history = AgentHistoryList(
+		history=[
+			_step([click], [ActionResult()]),
+			# the second action was not executed, e.g. because the page changed after the first one
+			_step([extract, click], [ActionResult(extracted_content='Extracted text')]),
+			# the model output failed to parse, so there is a result without an action
+			_step(None, [ActionResult(error='Invalid model output')]),
+			_step([done], [ActionResult(is_done=True, extracted_content='Task completed')]),
+		]
+	)
+
+	pairs = list(history.iter_actions_and_content())
+
+	assert [action for action, _ in pairs if action is not None] == history.model_actions()
+	assert pairs == [
+		({'click_element': {'index': 1}, 'interacted_element': None}, None),
+		({'extract_page_content': {'value': 'text'}, 'interacted_element': None}, 'Extracted text'),
+		({'click_element': {'index': 1}, 'interacted_element': None}, None),
+		(None, None),
+		({'done': {'text': 'Task completed', 'success': True}, 'interacted_element': None}, 'Task completed'),
+	]
@@ -297,40 +297,44 @@ async def test_take_screenshot():
 
 
 @pytest.mark.asyncio
-async def test_refresh_page_behavior():
+@pytest.mark.parametrize('wait_until', ['load', 'domcontentloaded'])
+async def test_refresh_page_behavior(wait_until):
 	"""
 	Test the refresh_page method of BrowserContext to verify that it correctly reloads the current page
-	and waits for the page's load state. This is done by creating a dummy page that flags when its
-	reload and wait_for_load_state methods are called.
+	and waits for the page's load state. This is done by creating a dummy page that records the load state
+	its reload and wait_for_load_state methods are called with, which must be the configured wait_until.
 	"""
 
 	class DummyPage:
 		def __init__(self):
-			self.reload_called = False
-			self.wait_for_load_state_called = False
+			self.url = 'https://example.com'
+			self.reload_wait_until = None
+			self.wait_for_load_state_state = None
 
-		async def reload(self):
-			self.reload_called = True
+		async def reload(self, wait_until=None):
+			self.reload_wait_until = wait_until
 
-		async def wait_for_load_state(self):
-			self.wait_for_load_state_called = True
+		async def wait_for_load_state(self, state=None):
+			self.wait_for_load_state_state = state
 
 	# Create a dummy session with the dummy page as the current_page.
 	dummy_page = DummyPage()
 	dummy_session = type('DummySession', (), {})()
 	dummy_session.current_page = dummy_page
-	dummy_session.context = None  # Not required for this test
+	# get_current_page picks the current page from the pages of the session's context
+	dummy_session.context = type('DummyContext', (), {'pages': [dummy_page]})()
 	# Create a dummy browser mock
 	dummy_browser = Mock()
 	dummy_browser.config = Mock()
+	dummy_browser.config.cdp_url = None
 	# Initialize BrowserContext with the dummy browser and config,
 	# and manually set its session to our dummy session.
-	context = BrowserContext(browser=dummy_browser, config=BrowserContextConfig())
+	context = BrowserContext(browser=dummy_browser, config=BrowserContextConfig(wait_until=wait_until))
 	context.session = dummy_session
-	# Call refresh_page and verify that reload and wait_for_load_state were called.
+	# Call refresh_page and verify that reload and wait_for_load_state were called with the configured load state.
 	await context.refresh_page()
-	assert dummy_page.reload_called is True, 'Expected the page to call reload()'
-	assert dummy_page.wait_for_load_state_called is True, 'Expected the page to call wait_for_load_state()'
+	assert dummy_page.reload_wait_until == wait_until, f'Expected reload(wait_until={wait_until!r})'
+	assert dummy_page.wait_for_load_state_state == wait_until, f'Expected wait_for_load_state({wait_until!r})'
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,222 @@
+from browser_use.agent.prompts import AgentMessagePrompt
+from browser_use.browser.views import BrowserState, TabInfo
+from browser_use.dom.views import DOMBaseNode, DOMElementNode, DOMTextNode
+
+
+def _text(text: str) -> DOMTextNode:
+	return DOMTextNode(is_visible=True, parent=None, text=text)
+
+
+def _element(
+	tag_name: str,
+	children: list[DOMBaseNode] | None = None,
+	attributes: dict[str, str] | None = None,
+	highlight_index: int | None = None,
+	is_new: bool | None = None,
+) -> DOMElementNode:
+	node = DOMElementNode(
+		is_visible=True,
+		parent=None,
+		tag_name=tag_name,
+		xpath=tag_name,
+		attributes=attributes or {},
+		children=children or [],
+		is_top_element=True,
+		highlight_index=highlight_index,
+		is_new=is_new,
+	)
+	for child in node.children:
+		child.parent = node
+	return node
+
+
+def _button_tree() -> DOMElementNode:
+	attributes = {
+		'id': 'save',
+		'class': 'btn btn-primary',
+		'style': 'color: red',
+		'data-testid': 'save-button',
+		'href': '/save',
+		'tabindex': '0',
+	}
+	return _element('div', [_element('a', [_text('Save')], attributes=attributes, highlight_index=0)])
+
+
+def test_minimal_attrs_keeps_only_minimal_attributes():
+	"""Test that minimal_attrs drops every attribute outside MINIMAL_ATTRIBUTES"""
+	text = _button_tree().clickable_elements_to_string(minimal_attrs=True)
+
+	assert text == "[0]<a id='save' href='/save'>Save />"
+
+
+def test_minimal_attrs_intersects_include_attributes():
+	"""Test that minimal_attrs only keeps the include_attributes that are also minimal attributes"""
+	tree = _button_tree()
+
+	assert tree.clickable_elements_to_string(include_attributes=['id', 'style', 'tabindex']) == (
+		"[0]<a id='save' style='color: red' tabindex='0'>Save />"
+	)
+	assert tree.clickable_elements_to_string(include_attributes=['id', 'style', 'tabindex'], minimal_attrs=True) == (
+		"[0]<a id='save'>Save />"
+	)
+
+
+def test_agent_message_prompt_passes_minimal_attrs():
+	"""Test that the agent state message is rendered with minimal_attrs"""
+	state = BrowserState(
+		url='https://test.com',
+		title='Test Page',
+		tabs=[TabInfo(page_id=1, url='https://test.com', title='Test Page')],
+		element_tree=_button_tree(),
+		selector_map={},
+	)
+
+	content = (
+		AgentMessagePrompt(state, include_attributes=['id', 'style'], minimal_attrs=True)
+		.get_user_message(use_vision=False)
+		.content
+	)
+
+	assert "[0]<a id='save'>Save />" in content
+	assert 'style' not in content
+
+
+def _page(link_text: str = 'Docs', first_index: int = 0, button_is_new: bool | None = None) -> DOMElementNode:
+	return _element(
+		'body',
+		[
+			_element(
+				'nav',
+				[
+					_element('a', [_text(link_text)], {'href': '/docs'}, highlight_index=first_index),
+					_element('a', [_text('Blog')], {'href': '/blog'}, highlight_index=first_index + 1),
+				],
+			),
+			_element(
+				'main',
+				[
+					_text('Welcome'),
+					_element(
+						'button',
+						[_element('span', [_text('Sign in')])],
+						{'type': 'button'},
+						highlight_index=first_index + 2,
+						is_new=button_is_new,
+					),
+				],
+			),
+		],
+	)
+
+
+def test_render_cache_matches_uncached_rendering():
+	"""Test that rendering consecutive page states through the render cache gives the same text as rendering them directly"""
+	states = [
+		{},
+		{},
+		{'button_is_new': True},
+		{'first_index': 5},
+		{'link_text': 'Documentation'},
+		{},
+	]
+	render_cache: dict = {}
+	for state in states:
+		expected = _page(**state).clickable_elements_to_string(include_attributes=['href', 'type'])
+		cached = _page(**state).clickable_elements_to_string(include_attributes=['href', 'type'], render_cache=render_cache)
+		assert cached == expected, state
+
+	base = _page().clickable_elements_to_string(include_attributes=['href', 'type'])
+	for state in states[2:5]:
+		assert _page(**state).clickable_elements_to_string(include_attributes=['href', 'type']) != base, state
+
+
+def test_render_cache_matches_after_in_place_change():
+	"""Test that the render cache picks up changes made to a tree after it was rendered"""
+	tree = _page()
+	render_cache: dict = {}
+	tree.clickable_elements_to_string(render_cache=render_cache)
+
+	button = tree.children[1].children[1]
+	assert isinstance(button, DOMElementNode)
+	button.is_new = True
+	button.highlight_index = 7
+
+	assert tree.clickable_elements_to_string(render_cache=render_cache) == tree.clickable_elements_to_string()
+	assert '*[7]*<button' in tree.clickable_elements_to_string()
+
+
+def test_contains_text_match_and_miss():
+	"""Test that contains_text finds text in any text node of the subtree"""
+	tree = _page()
+
+	assert tree.contains_text('Welcome')
+	assert tree.contains_text('elcom')
+	assert not tree.contains_text('Goodbye')
+
+
+def test_contains_text_searches_clickable_children():
+	"""Test that contains_text also searches text inside clickable elements, unlike the text till the next clickable"""
+	tree = _page()
+
+	assert 'Sign in' not in tree.get_all_text_till_next_clickable_element()
+	assert tree.contains_text('Sign in')
+
+
+def test_contains_text_does_not_match_across_text_nodes():
+	"""Test that a needle split across two text nodes is not found"""
+	tree = _element('p', [_text('Captcha is'), _text('passed successfully')])
+
+	assert tree.contains_text('passed successfully')
+	assert not tree.contains_text('Captcha is passed successfully')
+
+
+def test_clickable_text_follows_in_place_changes():
+	"""Test that the text till the next clickable element reflects changes made to the tree after it was read"""
+	intro = _text('Intro')
+	link = _element('a', [_text('guide')], {'href': '/guide'}, highlight_index=0)
+	tree = _element(
+		'div',
+		[
+			intro,
+			_element('p', [_text('Read the'), link, _text('first')]),
+			_element(
+				'form',
+				[
+					_element('label', [_text('Email')]),
+					_element('input', highlight_index=1),
+					_element('button', [_element('span', [_text('Submit')])], highlight_index=2),
+				],
+				highlight_index=3,
+			),
+		],
+	)
+	assert tree.get_all_text_till_next_clickable_element() == 'Intro\nRead the\nfirst'
+
+	link.highlight_index = None
+	intro.text = 'Welcome'
+
+	assert tree.get_all_text_till_next_clickable_element() == 'Welcome\nRead the\nguide\nfirst'
+	assert tree.get_all_text_till_next_clickable_element(max_depth=1) == 'Welcome'
+
+
+def test_rendered_text_skips_text_under_highlighted_ancestors():
+	"""Test that the threaded highlighted-ancestor flag hides the same text nodes as has_parent_with_highlight_index"""
+	tree = _page()
+	button = tree.children[1].children[1]
+	assert isinstance(button, DOMElementNode)
+	span = button.children[0]
+	assert isinstance(span, DOMElementNode)
+	sign_in = span.children[0]
+	assert isinstance(sign_in, DOMTextNode)
+	welcome = tree.children[1].children[0]
+	assert isinstance(welcome, DOMTextNode)
+
+	assert sign_in.has_parent_with_highlight_index()
+	assert not welcome.has_parent_with_highlight_index()
+
+	# the button text is only rendered as part of the button, not as a separate text line
+	assert tree.clickable_elements_to_string() == '[0]<a >Docs />\n[1]<a >Blog />\nWelcome\n[2]<button >Sign in />'
+
+	# rendering a subtree on its own still knows about its highlighted ancestor
+	assert span.clickable_elements_to_string() == ''
+	assert tree.children[1].clickable_elements_to_string() == 'Welcome\n[2]<button >Sign in />'
@@ -0,0 +1,138 @@
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+from browser_use.agent.memory.service import Memory
+from browser_use.agent.message_manager.service import MessageManager, MessageManagerSettings
+from browser_use.agent.message_manager.views import MessageHistory
+from browser_use.agent.views import ActionResult, MessageManagerState
+from browser_use.browser.views import BrowserState, TabInfo
+from browser_use.dom.views import DOMElementNode, DOMTextNode
+
+
+def _manager(max_input_tokens: int = 128000) -> MessageManager:
+	return MessageManager(
+		task='Test task',
+		system_message=SystemMessage(content='Test actions'),
+		settings=MessageManagerSettings(max_input_tokens=max_input_tokens, estimated_characters_per_token=3, image_tokens=800),
+		state=MessageManagerState(),
+	)
+
+
+def _state(i: int) -> BrowserState:
+	return BrowserState(
+		url=f'https://test{i}.com',
+		title=f'Test Page {i}',
+		element_tree=DOMElementNode(
+			tag_name='div',
+			attributes={},
+			children=[DOMTextNode(text=f'Content {i}', is_visible=True, parent=None)],
+			is_visible=True,
+			parent=None,
+			xpath='//div',
+		),
+		selector_map={},
+		tabs=[TabInfo(page_id=1, url=f'https://test{i}.com', title=f'Test Page {i}')],
+	)
+
+
+def _add_step(manager: MessageManager, i: int) -> None:
+	"""Add the messages of one agent step: the model output, its empty tool response and an action result"""
+	manager._add_message_with_tokens(
+		AIMessage(content='', tool_calls=[{'name': 'AgentOutput', 'args': {'step': i}, 'id': str(i), 'type': 'tool_call'}])
+	)
+	manager.add_tool_message(content='')
+	manager.add_state_message(_state(i), [ActionResult(extracted_content=f'Result of step {i}', include_in_memory=True)])
+	manager._remove_last_state_message()
+
+
+def _assert_matches_recompute(history: MessageHistory) -> None:
+	"""Check the incrementally maintained memory partition and token total against a full pass over the history"""
+	kept = [m for m in history.messages if m.metadata.message_type in ('init', 'memory')]
+	processable = [
+		m for m in history.messages if m.metadata.message_type not in ('init', 'memory') and len(m.message.content) > 0
+	]
+
+	kept_messages, processable_messages, processable_tokens = history.memory_partition()
+
+	assert [id(m) for m in kept_messages] == [id(m) for m in kept]
+	assert [id(m) for m in processable_messages] == [id(m) for m in processable]
+	assert processable_tokens == sum(m.metadata.tokens for m in processable)
+	assert history.current_tokens == sum(m.metadata.tokens for m in history.messages)
+
+
+def test_memory_partition_matches_recompute_after_add():
+	"""Test that appending and inserting messages keeps the partition equal to a full recompute"""
+	manager = _manager()
+	_assert_matches_recompute(manager.state.history)
+
+	for i in range(3):
+		_add_step(manager, i)
+		manager.add_state_message(_state(i))
+		manager.add_plan(f'Plan for step {i}', position=-1)
+		_assert_matches_recompute(manager.state.history)
+
+	manager.add_new_task('Follow-up task')
+	_assert_matches_recompute(manager.state.history)
+
+
+def test_memory_partition_matches_recompute_after_remove():
+	"""Test that removing the last state message and the oldest message keeps the partition equal to a full recompute"""
+	manager = _manager()
+	_add_step(manager, 0)
+
+	manager.add_state_message(_state(1))
+	manager._remove_last_state_message()
+	_assert_matches_recompute(manager.state.history)
+
+	manager.add_state_message(_state(2))
+	manager.add_plan('Plan', position=-1)
+	manager.state.history.remove_oldest_message()
+	manager._remove_last_state_message()
+	_assert_matches_recompute(manager.state.history)
+
+
+def test_memory_partition_matches_recompute_after_cut_messages():
+	"""Test that trimming the last message to fit max_input_tokens keeps the partition equal to a full recompute"""
+	manager = _manager()
+	_add_step(manager, 0)
+	history = manager.state.history
+
+	# drop the image of the last message
+	manager.settings.max_input_tokens = history.current_tokens + 1200
+	image_message = HumanMessage(
+		content=[
+			{'type': 'text', 'text': 'a' * 3000},
+			{'type': 'image_url', 'image_url': {'url': 'data:image/png;base64,AAAA'}},
+		]
+	)
+	manager._add_message_with_tokens(image_message)
+	manager.cut_messages()
+	assert history.messages[-1].message.content == 'a' * 3000
+	_assert_matches_recompute(history)
+
+	# trim the text of the last message
+	manager._remove_last_state_message()
+	manager.settings.max_input_tokens = history.current_tokens + 500
+	manager._add_message_with_tokens(HumanMessage(content='b' * 3000))
+	manager.cut_messages()
+	assert len(history.messages[-1].message.content) < 3000
+	_assert_matches_recompute(history)
+
+
+def test_memory_partition_matches_recompute_after_consolidate():
+	"""Test that consolidating into procedural memory keeps the partition and token total equal to a full recompute"""
+	manager = _manager()
+	for i in range(3):
+		_add_step(manager, i)
+	history = manager.state.history
+
+	memory = Memory.__new__(Memory)  # skip mem0 setup, consolidation only needs the message manager
+	memory.message_manager = manager
+	partitioned = memory._partition_messages()
+	assert partitioned is not None
+	memory._consolidate(*partitioned, memory_content='Summary of the first steps')
+
+	assert history.messages[-1].metadata.message_type == 'memory'
+	_assert_matches_recompute(history)
+
+	_add_step(manager, 3)
+	_assert_matches_recompute(history)
@@ -14,12 +14,15 @@ from browser_use.browser.browser import Browser, BrowserConfig
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import asyncio
-
 from langchain_openai import ChatOpenAI
 
 from browser_use import Agent, AgentHistoryList, Controller
 
+try:
+	from uvloop import new_event_loop
+except ImportError:
+	from asyncio import new_event_loop
+
 llm = ChatOpenAI(model='gpt-4o')
 controller = Controller()
 
@@ -44,7 +47,7 @@ async def done(text: str) -> str:
 @pytest.fixture(scope='function')
 def event_loop():
 	"""Create an instance of the default event loop for each test case."""
-	loop = asyncio.get_event_loop_policy().new_event_loop()
+	loop = new_event_loop()
 	yield loop
 	loop.close()
 
@@ -55,6 +58,7 @@ async def test_vision():
 		task='call explain_screen all the time the user asks you questions e.g. about the page like bbox which you see are labels  - your task is to explain it and get the next question',
 		llm=llm,
 		controller=controller,
+		screenshot_quality='low',
 		browser=Browser(config=BrowserConfig(disable_security=True, headless=False)),
 	)
 	try: